@@ -0,0 +1,177 @@
+package main
+
+import (
+	"encoding/json"
+	"os"
+	"os/exec"
+	"path/filepath"
+	"strings"
+	"testing"
+)
+
+func TestK8sManifestValidatorIndentedScalars(t *testing.T) {
+	root := repoRoot(t)
+	python := requirePython(t)
+	script := filepath.Join(root, "content", "skills", "infrastructure-management", "scripts", "validate-k8s-manifest.py")
+
+	cases := []struct {
+		name     string
+		manifest string
+		wantOK   bool
+		want     string
+	}{
+		{
+			name: "plain scalar on the line after its key",
+			manifest: "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: settings\n  annotations:\n" +
+				"    description:\n      Settings shared by the web tier,\n      wrapped onto two lines\n",
+			wantOK: true,
+		},
+		{
+			name: "quoted scalar on the line after its key",
+			manifest: "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: settings\n  annotations:\n" +
+				"    description:\n      \"Settings shared by the web tier,\n      wrapped onto two lines\"\n",
+			wantOK: true,
+		},
+		{
+			name:     "mapping entry indented under a plain scalar",
+			manifest: "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: settings\ndata:\n  mode: 1\n    other: 2\n",
+			want:     `"line": 7, "message": "Invalid YAML: mapping values are not allowed`,
+		},
+		{
+			name:     "mapping value inside a plain scalar on the key's line",
+			manifest: "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: settings\ndata:\n  mode: fast: yes\n",
+			want:     `"line": 6, "message": "Invalid YAML: mapping values are not allowed here`,
+		},
+		{
+			name:     "sequence entry on the key's line",
+			manifest: "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: settings\n  finalizers: - cleanup\n",
+			want:     `"line": 5, "message": "Invalid YAML: sequence entries are not allowed here`,
+		},
+		{
+			name:     "tab-indented line",
+			manifest: "apiVersion: v1\nkind: ConfigMap\nmetadata:\n\tname: settings\n",
+			want:     `"line": 4, "message": "Invalid YAML: tab characters are not allowed in indentation`,
+		},
+		{
+			name: "tab inside a block scalar",
+			manifest: "apiVersion: v1\nkind: ConfigMap\nmetadata:\n  name: settings\ndata:\n" +
+				"  Makefile: |\n    build:\n    \tgo build ./...\n",
+			wantOK: true,
+		},
+	}
+
+	for _, tc := range cases {
+		t.Run(tc.name, func(t *testing.T) {
+			dir := t.TempDir()
+			manifest := filepath.Join(dir, "manifest.yaml")
+			if err := os.WriteFile(manifest, []byte(tc.manifest), 0o644); err != nil {
+				t.Fatalf("WriteFile(%s) error = %v", manifest, err)
+			}
+			cmd := exec.Command(python, script, "--no-cache", "--format", "ndjson", manifest)
+			cmd.Env = envWith("XDG_CACHE_HOME=" + dir)
+			outputBytes, err := cmd.CombinedOutput()
+			output := string(outputBytes)
+			if tc.wantOK {
+				if err != nil {
+					t.Fatalf("validator rejected a valid manifest: %v\n%s", err, output)
+				}
+				if !strings.Contains(output, `"failed": 0`) {
+					t.Fatalf("validator reported failures for a valid manifest:\n%s", output)
+				}
+				return
+			}
+			if err == nil {
+				t.Fatalf("validator accepted an invalid manifest:\n%s", output)
+			}
+			if !strings.Contains(output, tc.want) {
+				t.Fatalf("validator output = %s, want %q", output, tc.want)
+			}
+		})
+	}
+}
+
+// convertArrayProbe runs convert_array on each input type and prints the
+// resulting values, or the exception type, per case as one JSON object.
+const convertArrayProbe = `
+import array, importlib.util, json, sys
+try:
+    import numpy
+except ImportError:
+    print(json.dumps({"skip": "numpy not installed"}))
+    sys.exit(0)
+spec = importlib.util.spec_from_file_location("convert_units", sys.argv[1])
+units = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(units)
+raw = numpy.array([0.0, 100.0]).tobytes()
+
+def run(make):
+    try:
+        return [float(v) for v in make()]
+    except Exception as e:
+        return type(e).__name__
+
+def in_place(buffer, view):
+    units.convert_array(view, "C", "K", inplace=True)
+    return numpy.frombuffer(buffer)
+
+doubles = array.array("d", [0.0, 100.0])
+scratch = bytearray(raw)
+listed = [0.0, 100.0]
+print(json.dumps({
+    "list": run(lambda: units.convert_array([0.0, 100.0], "C", "K")),
+    "bytes": run(lambda: units.convert_array(raw, "C", "K")),
+    "memoryview of bytes": run(lambda: units.convert_array(memoryview(raw), "C", "K")),
+    "memoryview of doubles": run(lambda: units.convert_array(memoryview(doubles), "C", "K")),
+    "in place bytearray memoryview": run(lambda: in_place(scratch, memoryview(scratch))),
+    "in place list": run(lambda: units.convert_array(listed, "C", "K", inplace=True)),
+    "list after in place": listed,
+    "in place bytes": run(lambda: units.convert_array(raw, "C", "K", inplace=True)),
+}))
+`
+
+func TestConvertUnitsArrayInputs(t *testing.T) {
+	root := repoRoot(t)
+	python := requirePython(t)
+	script := filepath.Join(root, "content", "skills", "power-systems-modeling", "scripts", "convert-units.py")
+
+	cmd := exec.Command(python, "-c", convertArrayProbe, script)
+	outputBytes, err := cmd.CombinedOutput()
+	if err != nil {
+		t.Fatalf("convert_array probe failed: %v\n%s", err, outputBytes)
+	}
+	var got map[string]any
+	if err := json.Unmarshal(outputBytes, &got); err != nil {
+		t.Fatalf("convert_array probe printed invalid JSON: %v\n%s", err, outputBytes)
+	}
+	if reason, ok := got["skip"]; ok {
+		t.Skip(reason)
+	}
+
+	converted := []any{273.15, 373.15}
+	want := map[string]any{
+		"list":                          converted,
+		"bytes":                         converted,
+		"memoryview of bytes":           converted,
+		"memoryview of doubles":         converted,
+		"in place bytearray memoryview": converted,
+		"in place list":                 "TypeError",
+		"list after in place":           []any{0.0, 100.0},
+		"in place bytes":                "TypeError",
+	}
+	for name, value := range want {
+		gotJSON, _ := json.Marshal(got[name])
+		wantJSON, _ := json.Marshal(value)
+		if string(gotJSON) != string(wantJSON) {
+			t.Errorf("%s: convert_array = %s, want %s", name, gotJSON, wantJSON)
+		}
+	}
+}
+
+func requirePython(t *testing.T) string {
+	t.Helper()
+	python, err := exec.LookPath("python3")
+	if err != nil {
+		t.Skip("python3 executable not found")
+	}
+	return python
+}
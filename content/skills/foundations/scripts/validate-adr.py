@@ -2,11 +2,24 @@
 """Validate Architecture Decision Record (ADR) format.
 
 Usage: validate-adr.py <adr-file.md>
+       validate-adr.py --corpus [docs/decisions] [--index] [--cache FILE]
+
+Corpus mode validates every ADR*.md under the directory and cross-checks the
+set: duplicate numbers, gaps in numbering, and Superseded ADRs whose
+successor does not exist. The parsed index is cached (default under
+$XDG_CACHE_HOME/loaf/) and refreshed per file by mtime; --index prints it
+as JSON.
 """
 
+import hashlib
+import json
+import os
 import re
 import sys
+import tempfile
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Optional
 
 VALID_STATUSES = {"Proposed", "Accepted", "Deprecated", "Superseded"}
 
@@ -16,60 +29,350 @@ REQUIRED_SECTIONS = [
     "Consequences",
 ]
 
+# Bump when validation rules or index fields change to invalidate caches
+INDEX_VERSION = 2
+
+ADR_REF = re.compile(r"ADR-?(\d+)", re.IGNORECASE)
+HEADING = re.compile(r"(#{1,6})\s+(.*?)\s*$")
+BOLD_FIELD = re.compile(r"\*\*([^*]+)\*\*:\s*([^*]*)")
+FRONTMATTER_FIELD = re.compile(r"([A-Za-z_]+):\s*(.*)")
+DATE = re.compile(r"\d{4}-\d{2}-\d{2}")
+WORD = re.compile(r"\w+")
+
+
+@dataclass
+class Section:
+    level: int
+    title: str
+    line: int
+    children: list["Section"] = field(default_factory=list)
+
+    def child(self, prefix: str) -> Optional["Section"]:
+        """First direct subsection whose title starts with ``prefix``."""
+        return next((c for c in self.children if c.title.startswith(prefix)), None)
+
+
+@dataclass
+class AdrDocument:
+    first_line: str = ""
+    title: Optional[Section] = None
+    frontmatter: dict[str, str] = field(default_factory=dict)
+    fields: dict[str, str] = field(default_factory=dict)  # **Name**: value, first occurrence
+    sections: list[Section] = field(default_factory=list)  # ## headings with ### children
+
+    def section(self, prefix: str) -> Optional[Section]:
+        """First ## section whose title starts with ``prefix``."""
+        return next((s for s in self.sections if s.title.startswith(prefix)), None)
+
+
+def parse_adr(content: str) -> AdrDocument:
+    """Tokenize an ADR in one pass into frontmatter, bold fields and a section tree.
+
+    Headings and fields inside fenced code blocks are ignored.
+    """
+    doc = AdrDocument()
+    lines = content.split("\n")
+    doc.first_line = lines[0] if lines else ""
+
+    in_frontmatter = doc.first_line.strip() == "---"
+    in_fence = False
+    current: Optional[Section] = None
+
+    for i, line in enumerate(lines[1:] if in_frontmatter else lines, 2 if in_frontmatter else 1):
+        if in_frontmatter:
+            if line.strip() == "---":
+                in_frontmatter = False
+                continue
+            match = FRONTMATTER_FIELD.match(line)
+            if match:
+                value = re.sub(r"\s+#.*$", "", match.group(2)).strip().strip("\"'")
+                doc.frontmatter[match.group(1)] = "" if value == "null" else value
+            continue
+
+        if line.lstrip().startswith(("```", "~~~")):
+            in_fence = not in_fence
+            continue
+        if in_fence:
+            continue
+
+        if line.startswith("#"):
+            match = HEADING.match(line)
+            if match:
+                section = Section(len(match.group(1)), match.group(2), i)
+                if section.level == 1:
+                    doc.title = doc.title or section
+                elif section.level == 2:
+                    doc.sections.append(section)
+                    current = section
+                elif current is not None:
+                    current.children.append(section)
+                continue
+
+        if "**" in line:
+            for match in BOLD_FIELD.finditer(line):
+                doc.fields.setdefault(match.group(1).strip(), match.group(2).strip())
+
+    return doc
+
 
 def validate_adr(filepath: Path) -> list[str]:
     """Validate ADR file and return list of errors."""
+    return validate_adr_content(filepath.name, filepath.read_text())
+
+
+def validate_adr_content(filename: str, content: str) -> list[str]:
+    """Validate ADR content and return list of errors."""
+    return validate_parsed_adr(filename, parse_adr(content))
+
+
+def validate_parsed_adr(filename: str, doc: AdrDocument) -> list[str]:
+    """Evaluate every ADR rule against the parsed document structure."""
     errors = []
-    content = filepath.read_text()
-    lines = content.split("\n")
 
     # Check filename format
-    filename = filepath.name
     if not re.match(r"ADR\d{3}-[\w-]+\.md", filename):
         errors.append(f"Filename should match ADRXXX-title.md pattern: {filename}")
 
     # Check for title
-    if not lines or not lines[0].startswith("# ADR-"):
+    if not doc.first_line.startswith("# ADR-"):
         errors.append("Missing ADR title (should start with '# ADR-XXX:')")
 
     # Check for decision date
-    date_pattern = r"\*\*Decision Date\*\*:\s*\d{4}-\d{2}-\d{2}"
-    if not re.search(date_pattern, content):
+    if not DATE.match(doc.fields.get("Decision Date", "")):
         errors.append("Missing Decision Date (format: **Decision Date**: YYYY-MM-DD)")
 
     # Check for status
-    status_match = re.search(r"\*\*Status\*\*:\s*(\w+)", content)
+    status_match = WORD.match(doc.fields.get("Status", ""))
     if not status_match:
         errors.append("Missing Status field")
-    elif status_match.group(1) not in VALID_STATUSES:
+    elif status_match.group(0) not in VALID_STATUSES:
         errors.append(
-            f"Invalid status '{status_match.group(1)}'. "
+            f"Invalid status '{status_match.group(0)}'. "
             f"Must be one of: {', '.join(VALID_STATUSES)}"
         )
 
     # Check for required sections
-    for section in REQUIRED_SECTIONS:
-        pattern = rf"^##\s+{section}"
-        if not re.search(pattern, content, re.MULTILINE):
-            errors.append(f"Missing required section: ## {section}")
-
-    # Check Consequences has subsections
-    if "## Consequences" in content:
-        if "### Positive" not in content:
+    for name in REQUIRED_SECTIONS:
+        if not doc.section(name):
+            errors.append(f"Missing required section: ## {name}")
+
+    # Check Consequences has subsections (scoped to that section)
+    consequences = doc.section("Consequences")
+    if consequences:
+        if not consequences.child("Positive"):
             errors.append("Consequences section missing ### Positive subsection")
-        if "### Negative" not in content:
+        if not consequences.child("Negative"):
             errors.append("Consequences section missing ### Negative subsection")
 
     # Check for Alternatives Considered
-    if "## Alternatives Considered" not in content:
+    if not doc.section("Alternatives Considered"):
         errors.append("Missing ## Alternatives Considered section (even if brief)")
 
     return errors
 
 
+def adr_refs(value: str) -> list[int]:
+    """Extract ADR numbers referenced in a field value."""
+    return [int(n) for n in ADR_REF.findall(value or "")]
+
+
+def index_entry(filepath: Path, doc: AdrDocument) -> dict:
+    """Extract the cross-reference fields of one ADR."""
+    fields = doc.frontmatter
+
+    # Prefer the frontmatter id, then the title, then the filename
+    number = None
+    for source in (fields.get("id", ""), doc.title.title if doc.title else "", filepath.name):
+        refs = adr_refs(source)
+        if refs:
+            number = refs[0]
+            break
+
+    title = fields.get("title", "")
+    if not title and doc.title:
+        title = re.sub(r"^ADR-?\d+:\s*", "", doc.title.title)
+
+    status = fields.get("status", "")
+    if not status:
+        status_match = WORD.match(doc.fields.get("Status", ""))
+        status = status_match.group(0) if status_match else ""
+
+    return {
+        "number": number,
+        "title": title,
+        "status": status,
+        "supersedes": adr_refs(fields.get("supersedes", "")),
+        "superseded_by": fields.get("superseded_by", "") or doc.fields.get("Superseded by", ""),
+    }
+
+
+def default_cache_path(decisions_dir: Path) -> Path:
+    """Per-directory index cache under $XDG_CACHE_HOME/loaf/."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "loaf"
+    digest = hashlib.sha256(str(decisions_dir.resolve()).encode()).hexdigest()[:16]
+    return cache_root / f"adr-index-{digest}.json"
+
+
+def load_index_cache(cache_path: Path) -> dict:
+    """Load cached per-file entries, or {} if missing or from another version."""
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if cache.get("version") != INDEX_VERSION:
+        return {}
+    return cache.get("files", {})
+
+
+def save_index_cache(cache_path: Path, files: dict) -> None:
+    """Write the index cache via a uniquely named temp file and rename.
+
+    Concurrent runs each write their own temp file; the last rename wins.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=f".{cache_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump({"version": INDEX_VERSION, "files": files}, f, separators=(",", ":"))
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def build_corpus_index(decisions_dir: Path, cache_path: Path) -> dict:
+    """Validate and index every ADR, reusing cached entries whose mtime is unchanged.
+
+    Returns {relative path: {"mtime": ..., "size": ..., "errors": [...], **fields}}.
+    """
+    cached = load_index_cache(cache_path)
+    files = {}
+    for filepath in sorted(decisions_dir.rglob("ADR*.md")):
+        rel = filepath.relative_to(decisions_dir).as_posix()
+        st = filepath.stat()
+        entry = cached.get(rel)
+        if entry and entry["mtime"] == st.st_mtime_ns and entry["size"] == st.st_size:
+            files[rel] = entry
+            continue
+        doc = parse_adr(filepath.read_text())
+        files[rel] = {
+            "mtime": st.st_mtime_ns,
+            "size": st.st_size,
+            "errors": validate_parsed_adr(filepath.name, doc),
+            **index_entry(filepath, doc),
+        }
+
+    if files != cached:
+        save_index_cache(cache_path, files)
+    return files
+
+
+def check_cross_references(files: dict) -> tuple[list[str], list[str]]:
+    """Report duplicate numbers and dangling supersede links (errors) and gaps (warnings)."""
+    errors = []
+    warnings = []
+    by_number: dict[int, list[str]] = {}
+    for rel, entry in files.items():
+        if entry["number"] is None:
+            errors.append(f"{rel}: Cannot determine ADR number")
+            continue
+        by_number.setdefault(entry["number"], []).append(rel)
+
+    for number, rels in sorted(by_number.items()):
+        if len(rels) > 1:
+            errors.append(f"Duplicate ADR number {number:03d}: {', '.join(rels)}")
+
+    if by_number:
+        numbers = sorted(by_number)
+        missing = sorted(set(range(numbers[0], numbers[-1] + 1)) - set(numbers))
+        for number in missing:
+            warnings.append(f"Gap in ADR numbering: ADR-{number:03d} not found")
+
+    for rel, entry in files.items():
+        if entry["status"] == "Superseded":
+            successors = adr_refs(entry["superseded_by"])
+            if not entry["superseded_by"]:
+                errors.append(f"{rel}: Superseded but no successor recorded (superseded_by)")
+            for successor in successors:
+                if successor not in by_number:
+                    errors.append(f"{rel}: Superseded by ADR-{successor:03d}, which does not exist")
+        for predecessor in entry["supersedes"]:
+            if predecessor not in by_number:
+                errors.append(f"{rel}: Supersedes ADR-{predecessor:03d}, which does not exist")
+
+    return errors, warnings
+
+
+def corpus_main(args: list[str]) -> None:
+    """Validate an entire ADR directory in one run."""
+    show_index = "--index" in args
+    cache_path = None
+    positional = []
+    i = 0
+    while i < len(args):
+        if args[i] == "--index":
+            pass
+        elif args[i] == "--cache" and i + 1 < len(args):
+            cache_path = Path(args[i + 1])
+            i += 1
+        else:
+            positional.append(args[i])
+        i += 1
+
+    decisions_dir = Path(positional[0] if positional else "docs/decisions")
+    if not decisions_dir.is_dir():
+        print(f"Error: Directory not found: {decisions_dir}")
+        sys.exit(1)
+
+    files = build_corpus_index(decisions_dir, cache_path or default_cache_path(decisions_dir))
+
+    if show_index:
+        index = [
+            {"file": rel, **{k: entry[k] for k in ("number", "title", "status", "supersedes", "superseded_by")}}
+            for rel, entry in files.items()
+        ]
+        print(json.dumps(index, indent=2))
+        sys.exit(0)
+
+    print(f"Validating corpus: {decisions_dir} ({len(files)} ADRs)")
+    print("=" * 50)
+
+    issue_count = 0
+    for rel, entry in files.items():
+        if entry["errors"]:
+            print(rel)
+            for error in entry["errors"]:
+                print(f"  ❌ {error}")
+            issue_count += len(entry["errors"])
+
+    cross_errors, cross_warnings = check_cross_references(files)
+    if cross_errors or cross_warnings:
+        print("Cross-references:")
+        for error in cross_errors:
+            print(f"  ❌ {error}")
+        for warning in cross_warnings:
+            print(f"  ⚠️  {warning}")
+    issue_count += len(cross_errors)
+
+    print("=" * 50)
+    if issue_count:
+        print(f"Found {issue_count} issue(s)")
+        sys.exit(1)
+    print("✓ All checks passed!")
+    sys.exit(0)
+
+
 def main():
+    if len(sys.argv) >= 2 and sys.argv[1] == "--corpus":
+        corpus_main(sys.argv[2:])
+
     if len(sys.argv) < 2:
         print("Usage: validate-adr.py <adr-file.md>")
+        print("       validate-adr.py --corpus [docs/decisions] [--index] [--cache FILE]")
         sys.exit(1)
 
     filepath = Path(sys.argv[1])
@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""Benchmark validate-k8s-manifest.py on synthetic manifest bundles.
+
+Usage:
+    bench-k8s-manifest.py [--sizes 1000,10000,100000] [--jobs 1,8] [--seed N]
+                          [--keep DIR] [--output results.json] [--baseline previous.json]
+
+Generates reproducible bundles with a realistic kind mix (Deployments,
+StatefulSets, DaemonSets, Jobs, CronJobs, Services, ConfigMaps, Secrets
+with stringData, ServiceAccounts, Ingresses). About 1% of documents are
+adversarial: multi-KiB stringData keys and image references full of colons,
+which expose regex predicates that backtrack.
+
+Each size runs in a fresh process so peak RSS is per bundle. Time is split
+into phases, measured per document while streaming:
+    split       finding document boundaries in the mapped file
+    parse       decoding and parsing each document into fields
+    checks      policy rules and bundle index records per document
+    cross_refs  the bundle-wide reference joins
+The phase split is of the serial path only. Each --jobs count is then timed
+end to end through validate_files, the code path behind the validator's own
+--jobs flag (range planning, worker pool, reference joins; no result cache),
+also in a fresh process per count.
+
+Returns JSON; with --baseline, each run also carries ratios against the
+matching run of an earlier result file (above 1.0 means slower or larger).
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from types import ModuleType
+
+VALIDATOR = Path(__file__).resolve().parent / "validate-k8s-manifest.py"
+
+# Bump when the bundle generator or result layout changes; results of different
+# formats are not comparable
+FORMAT_VERSION = 1
+
+PHASES = ("split", "parse", "checks", "cross_refs")
+
+# kind -> relative weight in a generated bundle
+KIND_MIX = {
+    "Deployment": 20,
+    "StatefulSet": 5,
+    "DaemonSet": 2,
+    "Job": 3,
+    "CronJob": 8,
+    "Service": 18,
+    "ConfigMap": 15,
+    "Secret": 12,
+    "ServiceAccount": 7,
+    "Ingress": 5,
+}
+
+ADVERSARIAL_SHARE = 0.01
+ADVERSARIAL_LENGTH = 4096
+
+NAMESPACES = ("prod", "staging", "payments", "search")
+
+
+def load_validator() -> ModuleType:
+    """Import validate-k8s-manifest.py, whose file name is not a module name."""
+    spec = importlib.util.spec_from_file_location("validate_k8s_manifest", VALIDATOR)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so worker processes can unpickle references to its functions
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+def container(rng: random.Random, name: str, image: str, indent: str) -> str:
+    """One container, randomly missing the settings the checks look for."""
+    lines = [f"- name: {name}", f"  image: {image}"]
+    if rng.random() < 0.8:
+        lines += ["  resources:", "    requests: {cpu: 100m, memory: 128Mi}", "    limits: {cpu: '1', memory: 256Mi}"]
+    if rng.random() < 0.7:
+        lines += ["  livenessProbe:", "    httpGet: {path: /healthz, port: 8080}"]
+        lines += ["  readinessProbe:", "    httpGet: {path: /ready, port: 8080}"]
+    lines += [
+        "  envFrom:",
+        f"  - configMapRef: {{name: {name}-config}}",
+        "  env:",
+        "  - name: DB_PASSWORD",
+        "    valueFrom:",
+        f"      secretKeyRef: {{name: {name}-secret, key: password}}",
+        "  securityContext:",
+        f"    allowPrivilegeEscalation: {'false' if rng.random() < 0.85 else 'true'}",
+        "    readOnlyRootFilesystem: true",
+    ]
+    return "\n".join(indent + line for line in lines)
+
+
+def pod_template(rng: random.Random, app: str, indent: str, adversarial: bool) -> str:
+    """A pod template; adversarial ones get an image reference made of colons."""
+    image = f"registry.local:5000/team/{app}:{rng.randint(1, 9)}.{rng.randint(0, 20)}.{rng.randint(0, 99)}"
+    if adversarial:
+        image = "registry.local/" + ":" * ADVERSARIAL_LENGTH + "/app"
+    elif rng.random() < 0.05:
+        image = f"{app}:latest"
+    return "\n".join([
+        f"{indent}metadata:",
+        f"{indent}  labels: {{app: {app}, tier: backend}}",
+        f"{indent}spec:",
+        f"{indent}  serviceAccountName: {app}",
+        f"{indent}  securityContext:",
+        f"{indent}    runAsNonRoot: true",
+        f"{indent}  containers:",
+        container(rng, app, image, indent + "  "),
+        f"{indent}  volumes:",
+        f"{indent}  - name: config",
+        f"{indent}    configMap: {{name: {app}-config}}",
+    ])
+
+
+def generate_document(rng: random.Random, kind: str, index: int) -> str:
+    """One document of the given kind, without the leading `---`."""
+    app = f"svc-{index % 500}"
+    name = f"{app}-{index}"
+    metadata = (
+        f"kind: {kind}\nmetadata:\n  name: {name}\n  namespace: {rng.choice(NAMESPACES)}\n"
+        f"  labels: {{app: {app}, team: team-{index % 17}}}\n"
+    )
+
+    def header(api: str) -> str:
+        return f"apiVersion: {api}\n{metadata}"
+
+    adversarial = rng.random() < ADVERSARIAL_SHARE
+
+    if kind in ("Deployment", "StatefulSet", "DaemonSet"):
+        replicas = "" if kind == "DaemonSet" else f"  replicas: {rng.randint(1, 6)}\n"
+        body = f"spec:\n{replicas}  selector:\n    matchLabels: {{app: {app}}}\n  template:\n"
+        return header("apps/v1") + body + pod_template(rng, app, "    ", adversarial)
+    if kind == "Job":
+        body = "spec:\n  backoffLimit: 3\n  template:\n"
+        return header("batch/v1") + body + pod_template(rng, app, "    ", adversarial)
+    if kind == "CronJob":
+        body = f"spec:\n  schedule: '{rng.randint(0, 59)} {rng.randint(0, 23)} * * *'\n  jobTemplate:\n    spec:\n      template:\n"
+        return header("batch/v1") + body + pod_template(rng, app, "        ", adversarial)
+    if kind == "Service":
+        body = f"spec:\n  selector: {{app: {app}}}\n  ports:\n  - {{port: 80, targetPort: 8080}}\n"
+        return header("v1") + body
+    if kind == "ConfigMap":
+        data = "".join(f"  setting_{i}: \"value-{rng.randint(0, 10**6)}\"\n" for i in range(rng.randint(3, 12)))
+        return header("v1") + "data:\n" + data
+    if kind == "Secret":
+        keys = ["username", "DB_PASSWORD", "api_token", "signing_key", "endpoint"]
+        if adversarial:
+            keys += ["k" * ADVERSARIAL_LENGTH, "PASSWORD_" * (ADVERSARIAL_LENGTH // 9)]
+        data = "".join(f"  {key}: {rng.getrandbits(64):x}\n" for key in rng.sample(keys, k=min(len(keys), 4)))
+        return header("v1") + "type: Opaque\nstringData:\n" + data
+    if kind == "ServiceAccount":
+        return header("v1") + f"imagePullSecrets:\n- name: {app}-pull\n"
+    body = (
+        f"spec:\n  tls:\n  - hosts: [{app}.example.com]\n    secretName: {app}-tls\n"
+        f"  rules:\n  - host: {app}.example.com\n    http:\n      paths:\n"
+        f"      - path: /\n        pathType: Prefix\n        backend:\n          service: {{name: {app}, port: {{number: 80}}}}\n"
+    )
+    return header("networking.k8s.io/v1") + body
+
+
+def generate_bundle(path: Path, documents: int, seed: int) -> dict:
+    """Write a bundle of `documents` documents; return the count per kind."""
+    rng = random.Random(f"{seed}:{documents}")
+    kinds = rng.choices(list(KIND_MIX), weights=list(KIND_MIX.values()), k=documents)
+    with path.open("w") as f:
+        for index, kind in enumerate(kinds):
+            f.write("---\n" if index else "")
+            f.write(generate_document(rng, kind, index) + "\n")
+    return {kind: kinds.count(kind) for kind in KIND_MIX}
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process so far, in MiB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1 << 20 if sys.platform == "darwin" else 1 << 10), 1)
+
+
+def measure(path: Path) -> dict:
+    """Validate one bundle serially, timing each phase per document."""
+    validator = load_validator()
+    phases = dict.fromkeys(PHASES, 0.0)
+    documents = findings = 0
+    records = []
+    clock = time.perf_counter
+
+    with validator.open_manifest(path) as buffer:
+        slices = validator.document_slices(buffer)
+        while True:
+            start = clock()
+            item = next(slices, None)
+            split = clock()
+            phases["split"] += split - start
+            if item is None:
+                break
+            line, raw = item
+            parsed = validator.parse_document(raw, line)
+            parse = clock()
+            phases["parse"] += parse - split
+            if parsed is None:
+                continue
+            documents += 1
+            head, doc = parsed
+            if isinstance(doc, validator.ManifestError):
+                findings += 1
+                continue
+            findings += len(validator.validate_manifest(doc))
+            records.extend((path, head, record) for record in validator.index_document(doc))
+            phases["checks"] += clock() - parse
+
+    start = clock()
+    findings += len(validator.cross_reference(records))
+    phases["cross_refs"] = clock() - start
+
+    seconds = sum(phases.values())
+    size = path.stat().st_size
+    return {
+        "documents": documents,
+        "bytes": size,
+        "findings": findings,
+        "seconds": round(seconds, 4),
+        "docs_per_second": round(documents / seconds, 1) if seconds else None,
+        "mb_per_second": round(size / (1 << 20) / seconds, 2) if seconds else None,
+        "peak_rss_mb": peak_rss_mb(),
+        "phases": {phase: round(value, 4) for phase, value in phases.items()},
+    }
+
+
+def measure_jobs(path: Path, jobs: int) -> dict:
+    """Validate one bundle end to end on `jobs` workers, as the validator CLI does."""
+    validator = load_validator()
+    start = time.perf_counter()
+    results = list(validator.validate_files([path], jobs, cross_refs=True))
+    seconds = time.perf_counter() - start
+    documents = sum(result["documents"] for result in results)
+    return {
+        "findings": sum(len(result["errors"]) for result in results),
+        "seconds": round(seconds, 4),
+        "docs_per_second": round(documents / seconds, 1) if seconds else None,
+    }
+
+
+def run_child(*args: str) -> dict:
+    """Run this script in a fresh interpreter and return the JSON it prints."""
+    # A fresh interpreter per measurement keeps peak RSS and warm caches from carrying over
+    child = subprocess.run([sys.executable, __file__, *args], capture_output=True, text=True)
+    if child.returncode != 0:
+        raise RuntimeError(child.stderr)
+    return json.loads(child.stdout)
+
+
+def compare(run: dict, baseline: dict) -> dict:
+    """Ratios of this run to a baseline run (current / baseline; >1 is slower or larger)."""
+    def ratio(current, previous):
+        return round(current / previous, 3) if current is not None and previous else None
+
+    return {
+        "seconds": ratio(run["seconds"], baseline.get("seconds")),
+        "peak_rss_mb": ratio(run["peak_rss_mb"], baseline.get("peak_rss_mb")),
+        "phases": {
+            phase: ratio(run["phases"][phase], baseline.get("phases", {}).get(phase)) for phase in PHASES
+        },
+        "jobs": {
+            jobs: ratio(timing["seconds"], baseline.get("jobs", {}).get(jobs, {}).get("seconds"))
+            for jobs, timing in run["jobs"].items()
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark validate-k8s-manifest.py on synthetic bundles")
+    parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated document counts")
+    parser.add_argument(
+        "--jobs", default=f"1,{os.cpu_count() or 1}", help="Comma-separated worker counts to time end to end"
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed (same seed, same bundles)")
+    parser.add_argument("--keep", type=Path, metavar="DIR", help="Write bundles here instead of a temp dir")
+    parser.add_argument("--output", type=Path, help="Also write the JSON results to this file")
+    parser.add_argument("--baseline", type=Path, help="Earlier results to compare against")
+    parser.add_argument("--measure", type=Path, help=argparse.SUPPRESS)
+    parser.add_argument("--measure-jobs", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.measure:
+        if args.measure_jobs:
+            print(json.dumps(measure_jobs(args.measure, args.measure_jobs)))
+        else:
+            print(json.dumps(measure(args.measure)))
+        return
+
+    try:
+        sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    except ValueError:
+        print(f"Error: Invalid --sizes: {args.sizes}", file=sys.stderr)
+        sys.exit(1)
+    try:
+        job_counts = sorted({int(jobs) for jobs in args.jobs.split(",") if jobs.strip()})
+    except ValueError:
+        job_counts = []
+    if not job_counts or job_counts[0] < 1:
+        print(f"Error: Invalid --jobs: {args.jobs}", file=sys.stderr)
+        sys.exit(1)
+
+    baseline_runs = {}
+    if args.baseline:
+        try:
+            baseline = json.loads(args.baseline.read_text())
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error: Cannot read baseline {args.baseline}: {e}", file=sys.stderr)
+            sys.exit(1)
+        if baseline.get("format") == FORMAT_VERSION and baseline.get("seed") == args.seed:
+            baseline_runs = {run["documents"]: run for run in baseline.get("runs", [])}
+        else:
+            print("Warning: Baseline has another format or seed; not comparing", file=sys.stderr)
+
+    with tempfile.TemporaryDirectory(prefix="k8s-bench-") as tmp:
+        workdir = args.keep or Path(tmp)
+        workdir.mkdir(parents=True, exist_ok=True)
+        runs = []
+        for size in sizes:
+            bundle = workdir / f"bundle-{size}.yaml"
+            kinds = generate_bundle(bundle, size, args.seed)
+            try:
+                run = {"size": size, "kinds": kinds, **run_child("--measure", str(bundle))}
+                run["jobs"] = {
+                    str(jobs): run_child("--measure", str(bundle), "--measure-jobs", str(jobs))
+                    for jobs in job_counts
+                }
+            except RuntimeError as e:
+                print(f"Error: Benchmark of {size} documents failed:\n{e}", file=sys.stderr)
+                sys.exit(1)
+            if run["documents"] in baseline_runs:
+                run["vs_baseline"] = compare(run, baseline_runs[run["documents"]])
+            runs.append(run)
+
+    result = {
+        "benchmark": "validate-k8s-manifest",
+        "format": FORMAT_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        # --jobs timings only show a speedup up to this many workers
+        "cpus": os.cpu_count(),
+        "seed": args.seed,
+        "runs": runs,
+    }
+    output = json.dumps(result, indent=2)
+    if args.output:
+        args.output.write_text(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,16 @@
 #!/usr/bin/env python3
 """
 Check text for Linear compatibility.
-Usage: check-linear-format.py <file>
-       echo "text" | check-linear-format.py -
+Usage: check-linear-format.py [--fail-fast] <file>
+       echo "text" | check-linear-format.py [--fail-fast] -
+       check-linear-format.py --batch [--jobs N] <dir|glob>...
+
+Input is read line by line, so large documents are never held in memory.
+--fail-fast stops reading at the first error.
+
+--batch validates every markdown file under the given directories or
+globs on a process pool and prints one JSON object per file (NDJSON),
+then a {"summary": ...} line.
 
 Validates:
 - No emoji in progress lists
@@ -11,94 +19,201 @@ Validates:
 - No phase/stage terminology
 """
 
+import argparse
+import glob
+import json
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator
+
+
+# Rule table, compiled once at import: (pattern, severity, message).
+# Every rule is a search over a single line; a rule matching several times on
+# one line still reports once, but overlapping rules each report.
+EMOJI = r'[\U0001F300-\U0001F9FF\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF]'
+
+LINE_RULES = [
+    # Emoji bullets (not checkboxes)
+    (re.compile(r'^[\U0001F300-\U0001F9FF]'), 'error', "Emoji bullet (use Markdown checkboxes)"),
+    # Local file references
+    (re.compile(r'\.agents/(?:sessions|councils)/'), 'error', "Local file reference (remove before syncing to Linear)"),
+    (re.compile(r'/Users/[^/]+/'), 'error', "Absolute path (use relative paths)"),
+    # Phase/stage terminology
+    (re.compile(r'\bPhase\s+\d', re.IGNORECASE), 'warning', "Avoid phase/stage terminology for Linear"),
+    (re.compile(r'\bStage\s+\d', re.IGNORECASE), 'warning', "Avoid phase/stage terminology for Linear"),
+    (re.compile(r'\bWeek\s+\d', re.IGNORECASE), 'warning', "Avoid phase/stage terminology for Linear"),
+    (re.compile(r'\bSprint\s+\d', re.IGNORECASE), 'warning', "Avoid phase/stage terminology for Linear"),
+    # Agent/council references
+    (re.compile(r'\bspawned\s+(implementer|reviewer|researcher)', re.IGNORECASE), 'warning', "Internal process reference (remove for Linear)"),
+    (re.compile(r'\bcouncil\s+decision', re.IGNORECASE), 'warning', "Internal process reference (remove for Linear)"),
+    # Issue ID with full title (Linear auto-expands)
+    (re.compile(r'[A-Z]+-\d+\s+[A-Z]'), 'warning', "Issue ID may include title (Linear auto-expands)"),
+]
+
+# Progress-list emoji only applies to checkbox lines
+PROGRESS_ITEM = re.compile(r'[-*]\s*\[(.)\]')
+PROGRESS_EMOJI = re.compile(EMOJI)
+BULLET_ITEM = re.compile(r'[-*]\s+[^[\]]')
+
+# Union of every line rule: one search rejects the (common) clean line
+ANY_LINE_RULE = re.compile('|'.join(
+    f'(?{"i" if pattern.flags & re.IGNORECASE else ""}:{pattern.pattern})'
+    for pattern, _, _ in LINE_RULES
+))
+
+
+def iter_findings(lines: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """Yield (severity, message) findings while consuming lines.
+
+    Single pass: each line is tested against the compiled rule table, and the
+    checkbox/bullet totals are kept as running counters, so memory does not
+    grow with the input. Lines may keep their trailing newline.
+    """
+    checkbox_count = 0
+    bullet_count = 0
+
+    for i, line in enumerate(lines, 1):
+        line = line.rstrip('\n')
+        if line[:1] in ('-', '*'):
+            progress = PROGRESS_ITEM.match(line)
+            if progress:
+                if progress.group(1) in ' x':
+                    checkbox_count += 1
+                # Check for emoji in progress lists
+                if PROGRESS_EMOJI.search(line):
+                    yield 'error', f"Line {i}: Emoji in progress list (use checkboxes only)"
+            if BULLET_ITEM.match(line):
+                bullet_count += 1
+
+        if not ANY_LINE_RULE.search(line):
+            continue
+
+        for pattern, severity, message in LINE_RULES:
+            if pattern.search(line):
+                yield severity, f"Line {i}: {message}"
+
+    # Check for proper checkbox format
+    if bullet_count > 0 and checkbox_count == 0:
+        yield 'warning', "No checkboxes found - consider using '- [ ]' for progress tracking"
 
 
 def check_linear_format(content: str) -> tuple[list[str], list[str]]:
     """Check content for Linear compatibility issues."""
     errors = []
     warnings = []
+    for severity, message in iter_findings(content.split('\n')):
+        (errors if severity == 'error' else warnings).append(message)
+    return errors, warnings
 
-    lines = content.split('\n')
 
-    for i, line in enumerate(lines, 1):
-        # Check for emoji in progress lists (common Unicode emoji ranges)
-        if re.match(r'^[-*]\s*\[.\]', line):
-            # Check for emoji
-            emoji_pattern = r'[\U0001F300-\U0001F9FF\U0001FA00-\U0001FA6F\U0001FA70-\U0001FAFF]'
-            if re.search(emoji_pattern, line):
-                errors.append(f"Line {i}: Emoji in progress list (use checkboxes only)")
-
-        # Check for emoji bullets (not checkboxes)
-        if re.match(r'^[\U0001F300-\U0001F9FF]', line):
-            errors.append(f"Line {i}: Emoji bullet (use Markdown checkboxes)")
-
-        # Check for local file references
-        if '.agents/sessions/' in line or '.agents/councils/' in line:
-            errors.append(f"Line {i}: Local file reference (remove before syncing to Linear)")
-
-        if re.search(r'/Users/[^/]+/', line):
-            errors.append(f"Line {i}: Absolute path (use relative paths)")
-
-        # Check for phase/stage terminology
-        phase_patterns = [
-            r'\bPhase\s+\d',
-            r'\bStage\s+\d',
-            r'\bWeek\s+\d',
-            r'\bSprint\s+\d',
-        ]
-        for pattern in phase_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                warnings.append(f"Line {i}: Avoid phase/stage terminology for Linear")
-
-        # Check for agent/council references
-        agent_patterns = [
-            r'\bspawned\s+(implementer|reviewer|researcher)',
-            r'\bcouncil\s+decision',
-        ]
-        for pattern in agent_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                warnings.append(f"Line {i}: Internal process reference (remove for Linear)")
-
-        # Check for issue ID with full title
-        if re.search(r'[A-Z]+-\d+\s+[A-Z]', line):
-            # Might be ID followed by title
-            warnings.append(f"Line {i}: Issue ID may include title (Linear auto-expands)")
+def check_stream(lines: Iterable[str], fail_fast: bool = False) -> tuple[list[str], list[str]]:
+    """Collect findings from a line stream, optionally stopping at the first error."""
+    errors = []
+    warnings = []
+    for severity, message in iter_findings(lines):
+        if severity == 'error':
+            errors.append(message)
+            if fail_fast:
+                break
+        else:
+            warnings.append(message)
+    return errors, warnings
 
-    # Check for proper checkbox format
-    checkbox_count = len(re.findall(r'^[-*]\s*\[[ x]\]', content, re.MULTILINE))
-    bullet_count = len(re.findall(r'^[-*]\s+[^[\]]', content, re.MULTILINE))
 
-    if bullet_count > 0 and checkbox_count == 0:
-        warnings.append("No checkboxes found - consider using '- [ ]' for progress tracking")
+def collect_batch_files(sources: list[str]) -> list[Path]:
+    """Expand directories (recursively, *.md) and globs into a sorted file list."""
+    files = set()
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            files.update(p for p in path.rglob('*.md') if p.is_file())
+        else:
+            files.update(Path(p) for p in glob.glob(source, recursive=True) if Path(p).is_file())
+    return sorted(files)
+
+
+def check_file(filepath: Path, fail_fast: bool = False) -> dict:
+    """Check one file and return its result record (safe to run in a worker)."""
+    try:
+        with open(filepath) as f:
+            errors, warnings = check_stream(f, fail_fast)
+    except (OSError, UnicodeDecodeError) as e:
+        return {"file": str(filepath), "errors": [f"Unreadable: {e}"], "warnings": []}
+    return {"file": str(filepath), "errors": errors, "warnings": warnings}
+
+
+def emit_batch_results(results: Iterable[dict]) -> dict:
+    """Print one NDJSON line per result and return the aggregate totals."""
+    totals = {"files": 0, "failed": 0, "errors": 0, "warnings": 0}
+    for result in results:
+        print(json.dumps(result, ensure_ascii=False))
+        totals["files"] += 1
+        totals["failed"] += bool(result["errors"])
+        totals["errors"] += len(result["errors"])
+        totals["warnings"] += len(result["warnings"])
+    return totals
+
+
+def run_batch(sources: list[str], jobs: int, fail_fast: bool) -> int:
+    """Validate many files on a worker pool, emitting NDJSON in stable order."""
+    files = collect_batch_files(sources)
+    fail_fast_flags = [fail_fast] * len(files)
+
+    # A pool only pays off once there is enough work to spread
+    if jobs > 1 and len(files) > jobs:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            chunksize = max(1, len(files) // (jobs * 4))
+            results = pool.map(check_file, files, fail_fast_flags, chunksize=chunksize)
+            totals = emit_batch_results(results)
+    else:
+        totals = emit_batch_results(map(check_file, files, fail_fast_flags))
 
-    return errors, warnings
+    print(json.dumps({"summary": totals}))
+    return 1 if totals["failed"] else 0
 
 
 def main():
+    parser = argparse.ArgumentParser(description="Check text for Linear compatibility")
+    parser.add_argument('source', nargs='*', help="File to check, or - for stdin (directories/globs with --batch)")
+    parser.add_argument('--fail-fast', action='store_true', help="Stop at the first error")
+    parser.add_argument('--batch', action='store_true', help="Validate many files and emit NDJSON")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help="Worker processes for --batch")
+    args = parser.parse_args()
+
     # Read input
-    if len(sys.argv) < 2:
-        print("Usage: check-linear-format.py <file>")
-        print("       echo 'text' | check-linear-format.py -")
+    if not args.source or (len(args.source) > 1 and not args.batch):
+        print("Usage: check-linear-format.py [--fail-fast] <file>")
+        print("       echo 'text' | check-linear-format.py [--fail-fast] -")
+        print("       check-linear-format.py --batch [--jobs N] <dir|glob>...")
         sys.exit(1)
 
-    if sys.argv[1] == '-':
-        content = sys.stdin.read()
+    if args.batch:
+        # Like a missing file below: a typo'd directory or glob must not pass as "0 files"
+        unmatched = [s for s in args.source if not Path(s).exists() and not glob.glob(s, recursive=True)]
+        if unmatched:
+            print(f"Error: {unmatched[0]} not found")
+            sys.exit(1)
+        sys.exit(run_batch(args.source, args.jobs, args.fail_fast))
+
+    if args.source[0] == '-':
+        stream = sys.stdin
         source = "stdin"
     else:
-        filepath = Path(sys.argv[1])
+        filepath = Path(args.source[0])
         if not filepath.exists():
             print(f"Error: {filepath} not found")
             sys.exit(1)
-        content = filepath.read_text()
+        stream = open(filepath)
         source = str(filepath)
 
     print(f"Checking Linear format: {source}")
     print("=" * 50)
 
-    errors, warnings = check_linear_format(content)
+    with stream:
+        errors, warnings = check_stream(stream, args.fail_fast)
 
     if errors:
         print("\nErrors (fix before syncing to Linear):")
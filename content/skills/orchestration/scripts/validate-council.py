@@ -2,14 +2,52 @@
 """
 Validate council file format and required fields.
 Usage: validate-council.py <council-file>
+       validate-council.py --batch [councils-dir] [--jobs N]
+       validate-council.py --query [councils-dir] [--status S] [--topic T] [--since YYYYMMDD] [--until YYYYMMDD]
 Exit codes: 0 = valid, 1 = invalid
+
+--batch validates every council in .agents/councils/ (or the given
+directory) on a process pool and prints one JSON result per file (NDJSON)
+followed by a summary line. Both --batch and --query maintain a compact
+index of (timestamp, topic, status, participant count, decision) under
+$XDG_CACHE_HOME/loaf/; only files that are new or whose mtime changed are
+re-read, so queries do not touch unchanged councils.
 """
 
+import argparse
+import bisect
+import hashlib
+import json
+import os
 import sys
 import re
-import yaml
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
+from typing import Iterable, Optional, TextIO
+
+REQUIRED_SECTIONS = ['## Context', '## Decision', '## Rationale']
+
+
+def load_yaml(text: str, errors: Optional[list[str]] = None) -> dict:
+    """Parse YAML with libyaml's C loader when available.
+
+    PyYAML is imported on first use so files without frontmatter (and
+    --help-style invocations) never pay for it. Parse errors are appended to
+    ``errors`` when given, printed otherwise.
+    """
+    import yaml
+
+    loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+    try:
+        return yaml.load(text, Loader=loader) or {}
+    except yaml.YAMLError as e:
+        message = f"Error parsing YAML frontmatter: {e}"
+        if errors is None:
+            print(message)
+        else:
+            errors.append(message)
+        return {}
 
 
 def parse_frontmatter(content: str) -> tuple[dict, str]:
@@ -21,13 +59,38 @@ def parse_frontmatter(content: str) -> tuple[dict, str]:
     if len(parts) < 3:
         return {}, content
 
-    try:
-        frontmatter = yaml.safe_load(parts[1])
-        body = parts[2]
-        return frontmatter or {}, body
-    except yaml.YAMLError as e:
-        print(f"Error parsing YAML frontmatter: {e}")
-        return {}, content
+    return load_yaml(parts[1]), parts[2]
+
+
+def read_frontmatter(f: TextIO, errors: Optional[list[str]] = None) -> tuple[dict, list[str]]:
+    """Read only the frontmatter block, leaving ``f`` positioned after it.
+
+    Returns (frontmatter, lines already consumed that belong to the body).
+    """
+    first = f.readline()
+    if not first.startswith('---'):
+        return {}, [first]
+
+    block = []
+    for line in f:
+        if line.rstrip() == '---':
+            return load_yaml(''.join(block), errors), []
+        block.append(line)
+
+    # Unterminated block: the whole file is body
+    return {}, [first, *block]
+
+
+def found_sections(lines: Iterable[str]) -> set[str]:
+    """Scan body lines for the required headings, stopping once all are seen."""
+    found = set()
+    for line in lines:
+        for section in REQUIRED_SECTIONS:
+            if section in line:
+                found.add(section)
+        if len(found) == len(REQUIRED_SECTIONS):
+            break
+    return found
 
 
 def validate_filename(filepath: Path) -> list[str]:
@@ -44,12 +107,18 @@ def validate_filename(filepath: Path) -> list[str]:
 def validate_frontmatter(fm: dict) -> list[str]:
     """Validate required frontmatter fields."""
     errors = []
+    if not isinstance(fm, dict):
+        errors.append("Frontmatter must be a mapping")
+        return errors
 
     # Check council block exists
     council = fm.get('council', {})
     if not council:
         errors.append("Missing 'council' block in frontmatter")
         return errors
+    if not isinstance(council, dict):
+        errors.append("'council' block must be a mapping")
+        return errors
 
     # Required council fields
     required_fields = ['topic', 'timestamp', 'status', 'participants', 'decision']
@@ -62,17 +131,19 @@ def validate_frontmatter(fm: dict) -> list[str]:
     if council.get('status') and council['status'] not in valid_statuses:
         errors.append(f"Invalid council.status: {council['status']} (must be one of: {', '.join(valid_statuses)})")
 
-    # Validate ISO 8601 timestamp
+    # Validate ISO 8601 timestamp (YAML already parses an unquoted one into a datetime)
     timestamp = council.get('timestamp', '')
-    if timestamp:
+    if timestamp and not isinstance(timestamp, date):
         try:
-            datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+            datetime.fromisoformat(str(timestamp).replace('Z', '+00:00'))
         except ValueError:
             errors.append(f"Invalid ISO 8601 timestamp: {timestamp}")
 
     # Validate participants
     participants = council.get('participants', [])
-    if participants:
+    if participants and not isinstance(participants, list):
+        errors.append("council.participants must be a list")
+    elif participants:
         if len(participants) < 5:
             errors.append(f"Council requires at least 5 participants (got {len(participants)})")
         if len(participants) % 2 == 0:
@@ -84,34 +155,176 @@ def validate_frontmatter(fm: dict) -> list[str]:
 def validate_sections(body: str) -> list[str]:
     """Validate required markdown sections."""
     errors = []
-    required_sections = ['## Context', '## Decision', '## Rationale']
 
-    for section in required_sections:
+    for section in REQUIRED_SECTIONS:
         if section not in body:
             errors.append(f"Missing required section: {section}")
 
     return errors
 
 
+def validate_council_file(filepath: Path) -> tuple[list[str], dict]:
+    """Validate one council file, returning (errors, frontmatter).
+
+    Fast path: parse only the frontmatter, then stream the body for headings.
+    """
+    errors = []
+    with open(filepath) as f:
+        frontmatter, body_head = read_frontmatter(f, errors)
+        sections = found_sections(body_head) | found_sections(f)
+
+    errors.extend(validate_filename(filepath))
+    errors.extend(validate_frontmatter(frontmatter))
+    errors.extend(f"Missing required section: {s}" for s in REQUIRED_SECTIONS if s not in sections)
+    return errors, frontmatter
+
+
+# Bump when validation rules or index fields change to invalidate the index
+INDEX_VERSION = 2
+# Below this many files to (re)read, process startup costs more than it saves
+POOL_THRESHOLD = 32
+
+
+def index_council(filepath: Path) -> dict:
+    """Validate a council and extract its index record (safe to run in a worker)."""
+    st = filepath.stat()
+    try:
+        errors, frontmatter = validate_council_file(filepath)
+    except (OSError, UnicodeDecodeError) as e:
+        errors, frontmatter = [f"Unreadable: {e}"], {}
+    council = frontmatter.get('council') if isinstance(frontmatter, dict) else None
+    council = council if isinstance(council, dict) else {}
+    participants = council.get('participants')
+    decision = council.get('decision')
+    timestamp = council.get('timestamp', '')
+    return {
+        "file": filepath.name,
+        "mtime": st.st_mtime_ns,
+        "size": st.st_size,
+        "timestamp": timestamp.isoformat() if isinstance(timestamp, date) else str(timestamp),
+        "topic": str(council.get('topic', '')),
+        "status": str(council.get('status', '')),
+        "participants": len(participants) if isinstance(participants, list) else 0,
+        "decision": "" if decision is None else str(decision),
+        "errors": errors,
+    }
+
+
+def default_index_path(councils_dir: Path) -> Path:
+    """Per-directory council index under $XDG_CACHE_HOME/loaf/."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "loaf"
+    digest = hashlib.sha256(str(councils_dir.resolve()).encode()).hexdigest()[:16]
+    return cache_root / f"council-index-{digest}.json"
+
+
+def load_index(index_path: Path) -> list[dict]:
+    """Load index records sorted by filename, or [] if missing or outdated."""
+    try:
+        with open(index_path) as f:
+            index = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return []
+    if index.get("version") != INDEX_VERSION:
+        return []
+    return index.get("councils", [])
+
+
+def save_index(index_path: Path, records: list[dict]) -> None:
+    """Write the index compactly via temp file and rename."""
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"version": INDEX_VERSION, "councils": records}, f, separators=(",", ":"))
+    os.replace(tmp_path, index_path)
+
+
+def refresh_index(councils_dir: Path, index_path: Path, jobs: int) -> tuple[list[dict], int]:
+    """Bring the index up to date, re-reading only new or modified councils.
+
+    Council filenames start with YYYYMMDD-HHMMSS, so sorting by name keeps the
+    index in chronological order. Returns (records, number of files re-read).
+    """
+    previous = {record["file"]: record for record in load_index(index_path)}
+    files = sorted(p for p in councils_dir.glob("*.md") if p.is_file())
+
+    stale = []
+    for filepath in files:
+        record = previous.get(filepath.name)
+        st = filepath.stat()
+        if not record or record["mtime"] != st.st_mtime_ns or record["size"] != st.st_size:
+            stale.append(filepath)
+
+    if jobs > 1 and len(stale) >= POOL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            fresh = list(pool.map(index_council, stale, chunksize=max(1, len(stale) // (jobs * 4))))
+    else:
+        fresh = [index_council(filepath) for filepath in stale]
+
+    updated = {record["file"]: record for record in fresh}
+    records = [updated.get(p.name) or previous[p.name] for p in files]
+    if fresh or len(records) != len(previous):
+        save_index(index_path, records)
+    return records, len(stale)
+
+
+def query_index(records: list[dict], status: Optional[str] = None, topic: Optional[str] = None,
+                since: Optional[str] = None, until: Optional[str] = None) -> list[dict]:
+    """Filter index records; --since/--until bisect the filename-ordered index."""
+    names = [record["file"] for record in records]
+    lo = bisect.bisect_left(names, since) if since else 0
+    # Any filename starting with the --until prefix is still in range
+    hi = bisect.bisect_right(names, until + "\uffff") if until else len(names)
+    matches = records[lo:hi]
+    if status:
+        matches = [r for r in matches if r["status"] == status]
+    if topic:
+        matches = [r for r in matches if topic.lower() in r["topic"].lower()]
+    return matches
+
+
 def main():
-    if len(sys.argv) != 2:
+    parser = argparse.ArgumentParser(description="Validate council file format and required fields")
+    parser.add_argument('path', nargs='?', help="Council file (or councils directory with --batch/--query)")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--batch', action='store_true', help="Validate every council in the directory")
+    mode.add_argument('--query', action='store_true', help="Query the council index")
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument('--status', help="Filter by council.status (--query)")
+    parser.add_argument('--topic', help="Filter by topic substring (--query)")
+    parser.add_argument('--since', help="Earliest YYYYMMDD[-HHMMSS] (--query)")
+    parser.add_argument('--until', help="Latest YYYYMMDD[-HHMMSS] (--query)")
+    args = parser.parse_args()
+
+    if args.batch or args.query:
+        councils_dir = Path(args.path or ".agents/councils")
+        if not councils_dir.is_dir():
+            print(f"Error: Directory not found: {councils_dir}")
+            sys.exit(1)
+        records, _ = refresh_index(councils_dir, default_index_path(councils_dir), args.jobs)
+
+        if args.query:
+            matches = query_index(records, args.status, args.topic, args.since, args.until)
+            print(json.dumps([{k: v for k, v in r.items() if k not in ("mtime", "size")} for r in matches], indent=2))
+            sys.exit(0)
+
+        failed = 0
+        for record in records:
+            print(json.dumps({"file": str(councils_dir / record["file"]), "errors": record["errors"]}))
+            failed += bool(record["errors"])
+        print(json.dumps({"summary": {"files": len(records), "failed": failed}}))
+        sys.exit(1 if failed else 0)
+
+    if not args.path:
         print("Usage: validate-council.py <council-file>")
         sys.exit(1)
 
-    filepath = Path(sys.argv[1])
+    filepath = Path(args.path)
 
     if not filepath.exists():
         print(f"Error: File not found: {filepath}")
         sys.exit(1)
 
-    content = filepath.read_text()
-    frontmatter, body = parse_frontmatter(content)
-
-    errors = []
-
-    errors.extend(validate_filename(filepath))
-    errors.extend(validate_frontmatter(frontmatter))
-    errors.extend(validate_sections(body))
+    errors, _ = validate_council_file(filepath)
 
     # Output results
     if errors:
@@ -5,143 +5,100 @@ Usage: convert-units.py <value> <from-unit> <to-unit>
        convert-units.py --list
 
 Supports: temperature, length, resistance, power, current, voltage
+
+Any two units of the same dimension convert: each pair resolves through
+the dimension's base unit into one cached multiply-add plan.
+
+Library use: convert() converts one value; convert_array() converts a whole
+NumPy array, sequence, or float64 buffer in one vectorized pass (optionally
+in place). NumPy is imported only when convert_array() is called.
 """
 
 import argparse
 import sys
-from typing import Callable
-
-
-# Conversion functions
-# Temperature: C, K, F
-def c_to_k(c: float) -> float:
-    return c + 273.15
-
-def k_to_c(k: float) -> float:
-    return k - 273.15
-
-def c_to_f(c: float) -> float:
-    return c * 9/5 + 32
-
-def f_to_c(f: float) -> float:
-    return (f - 32) * 5/9
-
-# Length: m, ft, km, mi
-def m_to_ft(m: float) -> float:
-    return m * 3.28084
-
-def ft_to_m(ft: float) -> float:
-    return ft / 3.28084
-
-def m_to_km(m: float) -> float:
-    return m / 1000
-
-def km_to_m(km: float) -> float:
-    return km * 1000
-
-def km_to_mi(km: float) -> float:
-    return km * 0.621371
-
-def mi_to_km(mi: float) -> float:
-    return mi / 0.621371
-
-# Resistance: ohm/km, ohm/mi, ohm/1000ft
-def ohm_km_to_ohm_mi(r: float) -> float:
-    return r * 1.60934
-
-def ohm_mi_to_ohm_km(r: float) -> float:
-    return r / 1.60934
-
-def ohm_km_to_ohm_kft(r: float) -> float:
-    return r * 0.3048
-
-def ohm_kft_to_ohm_km(r: float) -> float:
-    return r / 0.3048
-
-# Power: W, kW, MW, hp
-def w_to_kw(w: float) -> float:
-    return w / 1000
-
-def kw_to_w(kw: float) -> float:
-    return kw * 1000
-
-def kw_to_mw(kw: float) -> float:
-    return kw / 1000
-
-def mw_to_kw(mw: float) -> float:
-    return mw * 1000
-
-def kw_to_hp(kw: float) -> float:
-    return kw * 1.34102
-
-def hp_to_kw(hp: float) -> float:
-    return hp / 1.34102
-
-# Speed: m/s, ft/s, km/h, mph
-def ms_to_fts(ms: float) -> float:
-    return ms * 3.28084
+from fractions import Fraction
+from functools import lru_cache, partial
+from typing import Any, Callable, Optional
+
+
+# Unit graph: every unit has one affine edge to its dimension's base unit,
+#   value_in_base = value * scale + offset
+# Factors are exact rationals built from the published constants, so a
+# composed plan is rounded to float only once.
+FT_PER_M = Fraction('3.28084')
+MI_PER_KM = Fraction('0.621371')
+KM_PER_MI = Fraction('1.60934')
+KM_PER_KFT = Fraction('0.3048')
+HP_PER_KW = Fraction('1.34102')
+
+
+def _unit(dimension: str, scale: Fraction, offset: Fraction = Fraction(0)) -> tuple[str, Fraction, Fraction]:
+    return dimension, Fraction(scale), Fraction(offset)
+
+
+# unit -> (dimension, scale, offset); listing order is the --list order
+UNITS: dict[str, tuple[str, Fraction, Fraction]] = {
+    # Temperature (base K)
+    'C': _unit('Temperature', 1, Fraction('273.15')),
+    'K': _unit('Temperature', 1),
+    'F': _unit('Temperature', Fraction(5, 9), Fraction('273.15') - Fraction(32 * 5, 9)),
+
+    # Length (base m)
+    'm': _unit('Length', 1),
+    'ft': _unit('Length', 1 / FT_PER_M),
+    'km': _unit('Length', 1000),
+    'mi': _unit('Length', 1000 / MI_PER_KM),
+
+    # Resistance (base ohm/km)
+    'ohm/km': _unit('Resistance', 1),
+    'ohm/mi': _unit('Resistance', 1 / KM_PER_MI),
+    'ohm/kft': _unit('Resistance', 1 / KM_PER_KFT),
+
+    # Power (base W)
+    'W': _unit('Power', 1),
+    'kW': _unit('Power', 1000),
+    'MW': _unit('Power', 1000000),
+    'hp': _unit('Power', 1000 / HP_PER_KW),
+
+    # Speed (base m/s)
+    'm/s': _unit('Speed', 1),
+    'ft/s': _unit('Speed', 1 / FT_PER_M),
+    'km/h': _unit('Speed', Fraction(1000, 3600)),
+    'mph': _unit('Speed', Fraction(1000, 3600) / MI_PER_KM),
+}
 
-def fts_to_ms(fts: float) -> float:
-    return fts / 3.28084
 
-def ms_to_kmh(ms: float) -> float:
-    return ms * 3.6
+@lru_cache(maxsize=None)
+def conversion_plan(from_unit: str, to_unit: str) -> Optional[tuple[float, float]]:
+    """
+    Fuse from_unit -> base -> to_unit into one affine step.
+    Returns (scale, offset) so that result = value * scale + offset, or None
+    if either unit is unknown or the dimensions differ.
+    """
+    source = UNITS.get(from_unit)
+    target = UNITS.get(to_unit)
+    if source is None or target is None or source[0] != target[0]:
+        return None
 
-def kmh_to_ms(kmh: float) -> float:
-    return kmh / 3.6
+    _, from_scale, from_offset = source
+    _, to_scale, to_offset = target
+    return float(from_scale / to_scale), float((from_offset - to_offset) / to_scale)
 
-def kmh_to_mph(kmh: float) -> float:
-    return kmh * 0.621371
 
-def mph_to_kmh(mph: float) -> float:
-    return mph / 0.621371
+def apply_plan(value: Any, plan: tuple[float, float]) -> Any:
+    """Apply a plan to a float or a NumPy array with the same operations."""
+    scale, offset = plan
+    result = value * scale
+    # Skipping a zero offset keeps -0.0 and matches the in-place array path
+    return result + offset if offset else result
 
 
-# Conversion registry: (from_unit, to_unit) -> function
+# Conversion registry: (from_unit, to_unit) -> function, for every same-dimension pair
 CONVERSIONS: dict[tuple[str, str], Callable[[float], float]] = {
-    # Temperature
-    ('C', 'K'): c_to_k,
-    ('K', 'C'): k_to_c,
-    ('C', 'F'): c_to_f,
-    ('F', 'C'): f_to_c,
-    ('K', 'F'): lambda k: c_to_f(k_to_c(k)),
-    ('F', 'K'): lambda f: c_to_k(f_to_c(f)),
-
-    # Length
-    ('m', 'ft'): m_to_ft,
-    ('ft', 'm'): ft_to_m,
-    ('m', 'km'): m_to_km,
-    ('km', 'm'): km_to_m,
-    ('km', 'mi'): km_to_mi,
-    ('mi', 'km'): mi_to_km,
-    ('m', 'mi'): lambda m: km_to_mi(m_to_km(m)),
-    ('mi', 'm'): lambda mi: km_to_m(mi_to_km(mi)),
-
-    # Resistance
-    ('ohm/km', 'ohm/mi'): ohm_km_to_ohm_mi,
-    ('ohm/mi', 'ohm/km'): ohm_mi_to_ohm_km,
-    ('ohm/km', 'ohm/kft'): ohm_km_to_ohm_kft,
-    ('ohm/kft', 'ohm/km'): ohm_kft_to_ohm_km,
-
-    # Power
-    ('W', 'kW'): w_to_kw,
-    ('kW', 'W'): kw_to_w,
-    ('kW', 'MW'): kw_to_mw,
-    ('MW', 'kW'): mw_to_kw,
-    ('kW', 'hp'): kw_to_hp,
-    ('hp', 'kW'): hp_to_kw,
-    ('W', 'MW'): lambda w: kw_to_mw(w_to_kw(w)),
-    ('MW', 'W'): lambda mw: kw_to_w(mw_to_kw(mw)),
-
-    # Speed
-    ('m/s', 'ft/s'): ms_to_fts,
-    ('ft/s', 'm/s'): fts_to_ms,
-    ('m/s', 'km/h'): ms_to_kmh,
-    ('km/h', 'm/s'): kmh_to_ms,
-    ('km/h', 'mph'): kmh_to_mph,
-    ('mph', 'km/h'): mph_to_kmh,
-    ('m/s', 'mph'): lambda ms: kmh_to_mph(ms_to_kmh(ms)),
-    ('mph', 'm/s'): lambda mph: kmh_to_ms(mph_to_kmh(mph)),
+    (a, b): partial(apply_plan, plan=conversion_plan(a, b))
+    for a in UNITS
+    for b in UNITS
+    if a != b and conversion_plan(a, b) is not None
 }
 
 
@@ -178,31 +135,101 @@ def convert(value: float, from_unit: str, to_unit: str) -> tuple[float, str]:
     if from_unit == to_unit:
         return value, f"{value} {from_unit} = {value} {to_unit} (same unit)"
 
-    key = (from_unit, to_unit)
-    if key not in CONVERSIONS:
+    plan = conversion_plan(from_unit, to_unit)
+    if plan is None:
         return 0, f"Unknown conversion: {from_unit} -> {to_unit}"
 
-    result = CONVERSIONS[key](value)
+    result = apply_plan(value, plan)
     return result, f"{value} {from_unit} = {result:.6g} {to_unit}"
 
 
+def _numpy():
+    """Import NumPy on first use; only the array API needs it."""
+    try:
+        import numpy
+    except ImportError:
+        raise RuntimeError('NumPy is required for array conversion (pip install numpy)') from None
+    return numpy
+
+
+def _raw_bytes(values: Any) -> bool:
+    """Whether `values` is an untyped byte buffer, to be read as native float64."""
+    if isinstance(values, (bytes, bytearray)):
+        return True
+    return isinstance(values, memoryview) and values.format in ('B', 'b', 'c')
+
+
+def convert_array(values: Any, from_unit: str, to_unit: str, inplace: bool = False) -> Any:
+    """
+    Convert many values between units in one vectorized pass.
+
+    Accepts a NumPy array, a sequence of numbers, or a buffer of float64
+    values (bytes, bytearray, array.array('d'), memoryview). Untyped byte
+    buffers are read as native float64; typed buffers keep their item type.
+    The whole float64 array goes through the same multiply-add plan as
+    convert(), so the results are identical to the scalar path.
+
+    With inplace=True the result is written back into `values`, which must
+    be a writable float64 array or buffer, and that array is returned;
+    anything else (a list, a read-only buffer, another dtype) raises
+    TypeError. Otherwise a new float64 array is returned. Raises ValueError
+    for an unknown conversion.
+    """
+    np = _numpy()
+    from_unit = normalize_unit(from_unit)
+    to_unit = normalize_unit(to_unit)
+
+    plan = None
+    if from_unit != to_unit:
+        plan = conversion_plan(from_unit, to_unit)
+        if plan is None:
+            raise ValueError(f"Unknown conversion: {from_unit} -> {to_unit}")
+
+    raw = _raw_bytes(values)
+    if raw:
+        # A view over the caller's bytes; a bytearray's view stays writable
+        array = np.frombuffer(values, dtype=np.float64)
+    elif inplace:
+        if not isinstance(values, np.ndarray):
+            try:
+                memoryview(values)
+            except TypeError:
+                raise TypeError('In-place conversion needs a writable float64 array or buffer') from None
+        array = np.asarray(values)
+    else:
+        array = np.array(values, dtype=np.float64)
+
+    if inplace and (array.dtype != np.float64 or not array.flags.writeable):
+        raise TypeError('In-place conversion needs a writable float64 array or buffer')
+    if plan is None:
+        return array if inplace or not raw else array.copy()
+
+    # Python floats overflow to inf silently; keep the array path just as quiet
+    with np.errstate(over='ignore', invalid='ignore'):
+        if not inplace:
+            return apply_plan(array, plan)
+        scale, offset = plan
+        np.multiply(array, scale, out=array)
+        if offset:
+            np.add(array, offset, out=array)
+    return array
+
+
 def list_conversions():
     """Print all available conversions."""
     print("Available Unit Conversions")
     print("=" * 50)
 
-    categories = {
-        'Temperature': ['C', 'K', 'F'],
-        'Length': ['m', 'ft', 'km', 'mi'],
-        'Resistance': ['ohm/km', 'ohm/mi', 'ohm/kft'],
-        'Power': ['W', 'kW', 'MW', 'hp'],
-        'Speed': ['m/s', 'ft/s', 'km/h', 'mph'],
-    }
+    categories: dict[str, list[str]] = {}
+    for unit, (dimension, _, _) in UNITS.items():
+        categories.setdefault(dimension, []).append(unit)
 
     for category, units in categories.items():
         print(f"\n{category}:")
         print(f"  Units: {', '.join(units)}")
 
+    print("\nAny two units in the same category can be converted.")
+
 
 def main():
     parser = argparse.ArgumentParser(description='Convert between units for power systems')
@@ -2,17 +2,52 @@
 """Validate security compliance checklist completion.
 
 Usage: validate-compliance.py <checklist-file.md>
+       validate-compliance.py [--json] [--jobs N] <file|dir|glob>...
 
 Checks that all checklist items are marked as complete.
+
+With several inputs, a directory (recursive *.md), a glob, or --json, every
+checklist is streamed line by line and a JSON report is printed with
+per-file and global completion percentages plus the incomplete items.
+Large sets are parsed on a process pool. A source that matches no checklist
+file is an error, not an empty report.
+
+--history [DB] records every item's state per run in a local SQLite store
+(default $XDG_DATA_HOME/loaf/compliance-history.db). Files whose content
+hash is unchanged are not re-parsed, and only items whose state changed
+since the previous run are reported. --trend prints completion per run.
 """
 
+import argparse
+import glob
+import hashlib
+import json
+import os
 import re
+import sqlite3
 import sys
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Iterable, Iterator
+
+# Checklist items: - [ ] or - [x]
+CHECKLIST_ITEM = re.compile(r"-\s+\[([ xX])\]\s+(.+)")
+
+# Below this many files, process startup costs more than it saves
+POOL_THRESHOLD = 32
+
+
+def iter_checklist_items(lines: Iterable[str]) -> Iterator[tuple[bool, str]]:
+    """Yield (checked, item) for each checklist line, in file order."""
+    for line in lines:
+        match = CHECKLIST_ITEM.match(line.strip())
+        if match:
+            yield match.group(1).lower() == "x", match.group(2)
 
 
-def parse_checklist(content: str) -> tuple[list[str], list[str]]:
-    """Parse markdown checklist items.
+def parse_checklist(content: str | Iterable[str]) -> tuple[list[str], list[str]]:
+    """Parse markdown checklist items from text or an iterable of lines.
 
     Returns:
         Tuple of (completed items, incomplete items)
@@ -20,35 +55,290 @@ def parse_checklist(content: str) -> tuple[list[str], list[str]]:
     completed = []
     incomplete = []
 
-    for line in content.split("\n"):
-        line = line.strip()
+    lines = content.split("\n") if isinstance(content, str) else content
+    for checked, item in iter_checklist_items(lines):
+        if checked:
+            completed.append(item)
+        else:
+            incomplete.append(item)
 
-        # Match checklist items: - [ ] or - [x]
-        match = re.match(r"-\s+\[([ xX])\]\s+(.+)", line)
-        if match:
-            checked = match.group(1).lower() == "x"
-            item = match.group(2)
+    return completed, incomplete
 
-            if checked:
-                completed.append(item)
-            else:
-                incomplete.append(item)
 
-    return completed, incomplete
+def percent(part: int, total: int) -> int:
+    """Whole-number percentage; an empty checklist counts as complete."""
+    return part * 100 // total if total else 100
+
+
+def collect_checklists(sources: list[str]) -> list[Path]:
+    """Expand files, directories (recursive *.md) and globs into a sorted list."""
+    files = set()
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            files.update(p for p in path.rglob("*.md") if p.is_file())
+        elif path.is_file():
+            files.add(path)
+        else:
+            files.update(Path(p) for p in glob.glob(source, recursive=True) if Path(p).is_file())
+    return sorted(files)
+
+
+def missing_sources(sources: list[str]) -> list[str]:
+    """Sources that match no checklist file, so a typo cannot pass as nothing to check."""
+    missing = []
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            found = any(p.is_file() for p in path.rglob("*.md"))
+        else:
+            found = path.is_file() or any(Path(p).is_file() for p in glob.iglob(source, recursive=True))
+        if not found:
+            missing.append(source)
+    return missing
+
+
+def summarize_checklist(filepath: Path) -> dict:
+    """Stream one checklist file and return its completion record."""
+    with open(filepath) as f:
+        completed, incomplete = parse_checklist(f)
+    total = len(completed) + len(incomplete)
+    return {
+        "file": str(filepath),
+        "total": total,
+        "completed": len(completed),
+        "percent": percent(len(completed), total),
+        "incomplete": incomplete,
+    }
+
+
+def aggregate(sources: list[str], jobs: int) -> dict:
+    """Build the per-file and global compliance report."""
+    files = collect_checklists(sources)
+    if jobs > 1 and len(files) >= POOL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(summarize_checklist, files, chunksize=max(1, len(files) // (jobs * 4))))
+    else:
+        results = [summarize_checklist(f) for f in files]
+
+    total = sum(r["total"] for r in results)
+    completed = sum(r["completed"] for r in results)
+    return {
+        "files": results,
+        "summary": {
+            "files": len(results),
+            "complete_files": sum(1 for r in results if not r["incomplete"]),
+            "total": total,
+            "completed": completed,
+            "incomplete": total - completed,
+            "percent": percent(completed, total),
+        },
+    }
+
+
+HISTORY_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    files INTEGER NOT NULL DEFAULT 0,
+    total INTEGER NOT NULL DEFAULT 0,
+    completed INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    last_run INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    path TEXT NOT NULL,
+    item_hash TEXT NOT NULL,
+    item TEXT NOT NULL,
+    checked INTEGER NOT NULL,
+    updated_run INTEGER NOT NULL,
+    PRIMARY KEY (path, item_hash)
+);
+CREATE TABLE IF NOT EXISTS item_events (
+    run_id INTEGER NOT NULL,
+    path TEXT NOT NULL,
+    item_hash TEXT NOT NULL,
+    checked INTEGER,
+    PRIMARY KEY (run_id, path, item_hash)
+);
+CREATE INDEX IF NOT EXISTS item_events_by_item ON item_events (path, item_hash);
+"""
+
+
+def default_history_path() -> Path:
+    """History store under $XDG_DATA_HOME/loaf/."""
+    data_root = Path(os.environ.get("XDG_DATA_HOME") or Path.home() / ".local" / "share")
+    return data_root / "loaf" / "compliance-history.db"
+
+
+def open_history(db_path: Path) -> sqlite3.Connection:
+    """Open (and create if needed) the compliance history store."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    conn.executescript(HISTORY_SCHEMA)
+    return conn
+
+
+def file_hash(filepath: Path) -> str:
+    """SHA-256 of the file's bytes."""
+    with open(filepath, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def keyed_items(filepath: Path) -> dict[str, tuple[str, bool]]:
+    """Map item_hash -> (item, checked); repeated items are keyed by occurrence."""
+    items = {}
+    seen: dict[str, int] = {}
+    with open(filepath) as f:
+        for checked, item in iter_checklist_items(f):
+            occurrence = seen.get(item, 0)
+            seen[item] = occurrence + 1
+            key = hashlib.sha256(f"{item}\0{occurrence}".encode()).hexdigest()[:16]
+            items[key] = (item, checked)
+    return items
+
+
+def record_history(sources: list[str], db_path: Path, jobs: int) -> dict:
+    """Record a run and return only the items whose state changed."""
+    files = collect_checklists(sources)
+    conn = open_history(db_path)
+    with conn:
+        run_id = conn.execute(
+            "INSERT INTO runs (started_at) VALUES (?)",
+            (datetime.now(timezone.utc).isoformat(timespec="seconds"),),
+        ).lastrowid
+
+        known_hashes = dict(conn.execute("SELECT path, content_hash FROM files"))
+        keys = {f: str(f.resolve()) for f in files}
+        hashes = {f: file_hash(f) for f in files}
+        changed = [f for f in files if known_hashes.get(keys[f]) != hashes[f]]
+
+        if jobs > 1 and len(changed) >= POOL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                parsed = list(pool.map(keyed_items, changed, chunksize=max(1, len(changed) // (jobs * 4))))
+        else:
+            parsed = [keyed_items(f) for f in changed]
+
+        changes = []
+        for filepath, items in zip(changed, parsed):
+            path = keys[filepath]
+            previous = {
+                key: (item, bool(checked))
+                for key, item, checked in conn.execute(
+                    "SELECT item_hash, item, checked FROM items WHERE path = ?", (path,)
+                )
+            }
+            # File order first, then items that disappeared
+            for key in [*items, *(k for k in previous if k not in items)]:
+                before = previous.get(key)
+                after = items.get(key)
+                if before and after and before[1] == after[1]:
+                    continue
+                item = (after or before)[0]
+                state = None if after is None else after[1]
+                changes.append({
+                    "file": str(filepath),
+                    "item": item,
+                    "from": None if before is None else ("complete" if before[1] else "incomplete"),
+                    "to": None if state is None else ("complete" if state else "incomplete"),
+                })
+                conn.execute(
+                    "INSERT INTO item_events (run_id, path, item_hash, checked) VALUES (?, ?, ?, ?)",
+                    (run_id, path, key, None if state is None else int(state)),
+                )
+                if after is None:
+                    conn.execute("DELETE FROM items WHERE path = ? AND item_hash = ?", (path, key))
+                else:
+                    conn.execute(
+                        "INSERT OR REPLACE INTO items (path, item_hash, item, checked, updated_run) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        (path, key, item, int(state), run_id),
+                    )
+            conn.execute(
+                "INSERT OR REPLACE INTO files (path, content_hash, last_run) VALUES (?, ?, ?)",
+                (path, hashes[filepath], run_id),
+            )
+
+        current = set(keys.values())
+        total = completed = 0
+        for path, count, done in conn.execute("SELECT path, COUNT(*), SUM(checked) FROM items GROUP BY path"):
+            if path in current:
+                total += count
+                completed += done
+        conn.execute(
+            "UPDATE runs SET files = ?, total = ?, completed = ? WHERE id = ?",
+            (len(files), total, completed, run_id),
+        )
+    conn.close()
+
+    return {
+        "run": run_id,
+        "reparsed_files": len(changed),
+        "changes": changes,
+        "summary": {
+            "files": len(files),
+            "total": total,
+            "completed": completed,
+            "incomplete": total - completed,
+            "percent": percent(completed, total),
+        },
+    }
+
+
+def history_trend(db_path: Path) -> list[dict]:
+    """Completion per recorded run, oldest first."""
+    conn = open_history(db_path)
+    rows = conn.execute("SELECT id, started_at, files, total, completed FROM runs ORDER BY id").fetchall()
+    conn.close()
+    return [
+        {"run": run_id, "started_at": started_at, "files": files, "total": total,
+         "completed": completed, "percent": percent(completed, total)}
+        for run_id, started_at, files, total, completed in rows
+    ]
 
 
 def main():
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(description="Validate security compliance checklist completion")
+    parser.add_argument("sources", nargs="*", help="Checklist files, directories, or globs")
+    parser.add_argument("--json", action="store_true", help="Print a JSON report")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes for large sets")
+    parser.add_argument("--history", nargs="?", type=Path, const=default_history_path(), metavar="DB",
+                        help="Record this run in a SQLite history and report only changed items")
+    parser.add_argument("--trend", action="store_true", help="Print completion per recorded run (with --history)")
+    args = parser.parse_args()
+
+    if args.trend:
+        print(json.dumps(history_trend(args.history or default_history_path()), indent=2))
+        sys.exit(0)
+
+    if not args.sources:
         print("Usage: validate-compliance.py <checklist-file.md>")
+        print("       validate-compliance.py [--json] [--jobs N] <file|dir|glob>...")
         sys.exit(1)
 
-    filepath = Path(sys.argv[1])
-    if not filepath.exists():
-        print(f"Error: File not found: {filepath}")
+    # Before --history, so a typo is not recorded as an empty, complete run
+    missing = missing_sources(args.sources)
+    if missing:
+        for source in missing:
+            print(f"Error: File not found: {source}")
         sys.exit(1)
 
-    content = filepath.read_text()
-    completed, incomplete = parse_checklist(content)
+    if args.history:
+        report = record_history(args.sources, args.history, args.jobs)
+        print(json.dumps(report, indent=2))
+        sys.exit(1 if report["summary"]["incomplete"] else 0)
+
+    if args.json or len(args.sources) > 1 or not Path(args.sources[0]).is_file():
+        report = aggregate(args.sources, args.jobs)
+        print(json.dumps(report, indent=2))
+        sys.exit(1 if report["summary"]["incomplete"] else 0)
+
+    filepath = Path(args.sources[0])
+    with open(filepath) as f:
+        completed, incomplete = parse_checklist(f)
 
     total = len(completed) + len(incomplete)
     if total == 0:
@@ -0,0 +1,332 @@
+#!/usr/bin/env python3
+"""Index councils, ADRs, roadmaps and checklists for full-text recall.
+
+Usage:
+    index-artifacts.py update [--root DIR]           # Refresh the index
+    index-artifacts.py search "query" [--kind KIND] [--limit N]
+    index-artifacts.py list [--kind KIND] [--status STATUS]
+
+The validators (validate-council.py, validate-adr.py, validate-roadmap.py,
+validate-compliance.py) parse each artifact; this script reuses their
+parsers and keeps the parsed fields, validation errors and body text in a
+SQLite FTS5 database under $XDG_CACHE_HOME/loaf/ (one per project root).
+Files are re-read only when their mtime or size changes and re-indexed only
+when their content hash changes. search and list refresh first unless
+--no-refresh is given.
+
+Returns JSON.
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import os
+import sqlite3
+import sys
+from pathlib import Path
+from types import ModuleType
+from typing import Optional
+
+SKILLS_DIR = Path(__file__).resolve().parents[2]
+
+# kind -> (validator script relative to the skills dir, glob patterns under the root)
+ARTIFACT_KINDS = {
+    "council": ("orchestration/scripts/validate-council.py", [".agents/councils/*.md"]),
+    "adr": ("foundations/scripts/validate-adr.py", ["docs/decisions/ADR*.md"]),
+    "roadmap": ("orchestration/scripts/validate-roadmap.py", ["ROADMAP.md", "docs/ROADMAP.md"]),
+    "checklist": ("foundations/scripts/validate-compliance.py", ["docs/**/*checklist*.md", ".agents/**/*checklist*.md"]),
+}
+
+# Bump when the schema or extracted fields change
+SCHEMA_VERSION = 2
+
+# artifacts_fts rows use the artifact's id as their rowid
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifacts (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL UNIQUE,
+    kind TEXT NOT NULL,
+    mtime INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    status TEXT NOT NULL DEFAULT '',
+    fields TEXT NOT NULL DEFAULT '{}',
+    errors TEXT NOT NULL DEFAULT '[]'
+);
+CREATE INDEX IF NOT EXISTS artifacts_by_kind ON artifacts (kind, status);
+CREATE VIRTUAL TABLE IF NOT EXISTS artifacts_fts USING fts5(
+    title, body, tokenize = 'porter unicode61'
+);
+"""
+
+_validators: dict[str, Optional[ModuleType]] = {}
+
+
+def load_validator(kind: str) -> Optional[ModuleType]:
+    """Import a sibling skill's validator by path, or None if not installed."""
+    if kind not in _validators:
+        script = SKILLS_DIR / ARTIFACT_KINDS[kind][0]
+        module = None
+        if script.exists():
+            spec = importlib.util.spec_from_file_location(f"loaf_{script.stem.replace('-', '_')}", script)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        _validators[kind] = module
+    return _validators[kind]
+
+
+def first_heading(text: str) -> str:
+    """Text of the first level-one Markdown heading, or "" if there is none."""
+    for line in text.split("\n"):
+        if line.startswith("# "):
+            return line[2:].strip()
+    return ""
+
+
+def parse_council(path: Path, text: str, validator: ModuleType) -> dict:
+    """Index fields of a council, from validate-council.py's index_council."""
+    record = validator.index_council(path)
+    return {
+        "title": record["topic"],
+        "status": record["status"],
+        "fields": {k: record[k] for k in ("timestamp", "topic", "participants", "decision")},
+        "errors": record["errors"],
+    }
+
+
+def parse_adr(path: Path, text: str, validator: ModuleType) -> dict:
+    """Index fields of an ADR, parsed once and validated from the same parse."""
+    doc = validator.parse_adr(text)
+    entry = validator.index_entry(path, doc)
+    return {
+        "title": entry["title"],
+        "status": entry["status"],
+        "fields": {k: entry[k] for k in ("number", "supersedes", "superseded_by")},
+        "errors": validator.validate_parsed_adr(path.name, doc),
+    }
+
+
+def parse_roadmap(path: Path, text: str, validator: ModuleType) -> dict:
+    """Index fields of a roadmap: its title and validation issues."""
+    return {
+        "title": first_heading(text),
+        "status": "",
+        "fields": {},
+        "errors": validator.check_roadmap(text),
+    }
+
+
+def parse_checklist(path: Path, text: str, validator: ModuleType) -> dict:
+    """Index fields of a checklist: item counts and the incomplete items."""
+    completed, incomplete = validator.parse_checklist(text)
+    total = len(completed) + len(incomplete)
+    return {
+        "title": first_heading(text),
+        "status": "incomplete" if incomplete else "complete",
+        "fields": {"total": total, "completed": len(completed), "incomplete": incomplete},
+        "errors": [],
+    }
+
+
+PARSERS = {
+    "council": parse_council,
+    "adr": parse_adr,
+    "roadmap": parse_roadmap,
+    "checklist": parse_checklist,
+}
+
+
+def default_db_path(root: Path) -> Path:
+    """Per-project index under $XDG_CACHE_HOME/loaf/."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "loaf"
+    digest = hashlib.sha256(str(root.resolve()).encode()).hexdigest()[:16]
+    return cache_root / f"artifacts-{digest}.db"
+
+
+def open_db(db_path: Path) -> sqlite3.Connection:
+    """Open the index, recreating it if it was built by another schema version."""
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+        conn.executescript("DROP TABLE IF EXISTS artifacts; DROP TABLE IF EXISTS artifacts_fts;")
+        conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    try:
+        conn.executescript(SCHEMA)
+    except sqlite3.OperationalError as e:
+        raise SystemExit(f"Error: SQLite FTS5 is unavailable ({e})")
+    return conn
+
+
+def discover(root: Path) -> dict[str, str]:
+    """Map relative path -> kind for every artifact under the root."""
+    found = {}
+    for kind, (_, patterns) in ARTIFACT_KINDS.items():
+        for pattern in patterns:
+            for path in root.glob(pattern):
+                if path.is_file():
+                    found.setdefault(path.relative_to(root).as_posix(), kind)
+    return found
+
+
+def update_index(conn: sqlite3.Connection, root: Path) -> dict:
+    """Bring the index in line with the tree, touching only changed files."""
+    found = discover(root)
+    known = {
+        path: (mtime, size, content_hash, artifact_id)
+        for artifact_id, path, mtime, size, content_hash in conn.execute(
+            "SELECT id, path, mtime, size, content_hash FROM artifacts"
+        )
+    }
+    stats = {"indexed": 0, "unchanged": 0, "removed": 0}
+
+    with conn:
+        for rel in known.keys() - found.keys():
+            artifact_id = known[rel][3]
+            conn.execute("DELETE FROM artifacts WHERE id = ?", (artifact_id,))
+            conn.execute("DELETE FROM artifacts_fts WHERE rowid = ?", (artifact_id,))
+            stats["removed"] += 1
+
+        for rel, kind in sorted(found.items()):
+            path = root / rel
+            st = path.stat()
+            previous = known.get(rel)
+            if previous and previous[:2] == (st.st_mtime_ns, st.st_size):
+                stats["unchanged"] += 1
+                continue
+
+            data = path.read_bytes()
+            content_hash = hashlib.sha256(data).hexdigest()
+            if previous and previous[2] == content_hash:
+                conn.execute("UPDATE artifacts SET mtime = ?, size = ? WHERE id = ?", (st.st_mtime_ns, st.st_size, previous[3]))
+                stats["unchanged"] += 1
+                continue
+
+            text = data.decode(errors="replace")
+            parsed = {"title": first_heading(text), "status": "", "fields": {}, "errors": []}
+            validator = load_validator(kind)
+            if validator:
+                # A validator bug on one file must not block indexing the rest
+                try:
+                    parsed = PARSERS[kind](path, text, validator)
+                except Exception as e:
+                    parsed["errors"] = [f"Validator failed: {e}"]
+
+            row = (kind, st.st_mtime_ns, st.st_size, content_hash, parsed["title"], parsed["status"],
+                   json.dumps(parsed["fields"], default=str), json.dumps(parsed["errors"]))
+            if previous:
+                # Update in place so the id, and with it the FTS rowid, stays put
+                artifact_id = previous[3]
+                conn.execute(
+                    "UPDATE artifacts SET kind = ?, mtime = ?, size = ?, content_hash = ?, title = ?, status = ?, "
+                    "fields = ?, errors = ? WHERE id = ?",
+                    (*row, artifact_id),
+                )
+                conn.execute("DELETE FROM artifacts_fts WHERE rowid = ?", (artifact_id,))
+            else:
+                artifact_id = conn.execute(
+                    "INSERT INTO artifacts (path, kind, mtime, size, content_hash, title, status, fields, errors) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (rel, *row),
+                ).lastrowid
+            conn.execute(
+                "INSERT INTO artifacts_fts (rowid, title, body) VALUES (?, ?, ?)",
+                (artifact_id, parsed["title"], text),
+            )
+            stats["indexed"] += 1
+
+    return stats
+
+
+def row_to_record(row: sqlite3.Row) -> dict:
+    """Turn an artifacts row into a JSON-ready record, decoding its stored fields and errors."""
+    record = dict(row)
+    record["fields"] = json.loads(record["fields"])
+    record["errors"] = json.loads(record["errors"])
+    return record
+
+
+def search(conn: sqlite3.Connection, query: str, kind: Optional[str], limit: int) -> list[dict]:
+    """Rank artifacts by BM25 relevance to an FTS5 query."""
+    conn.row_factory = sqlite3.Row
+    sql = (
+        "SELECT a.path, a.kind, a.title, a.status, a.fields, a.errors, "
+        "snippet(artifacts_fts, 1, '[', ']', '…', 12) AS snippet "
+        "FROM artifacts_fts JOIN artifacts a ON a.id = artifacts_fts.rowid "
+        "WHERE artifacts_fts MATCH ?"
+    )
+    params: list = [query]
+    if kind:
+        sql += " AND a.kind = ?"
+        params.append(kind)
+    sql += " ORDER BY bm25(artifacts_fts) LIMIT ?"
+    params.append(limit)
+    try:
+        return [row_to_record(row) for row in conn.execute(sql, params)]
+    except sqlite3.OperationalError as e:
+        raise SystemExit(f"Error: Invalid search query: {e}")
+
+
+def list_artifacts(conn: sqlite3.Connection, kind: Optional[str], status: Optional[str]) -> list[dict]:
+    """List indexed artifacts, optionally filtered by kind and status."""
+    conn.row_factory = sqlite3.Row
+    sql = "SELECT path, kind, title, status, fields, errors FROM artifacts WHERE 1 = 1"
+    params = []
+    if kind:
+        sql += " AND kind = ?"
+        params.append(kind)
+    if status:
+        sql += " AND status = ?"
+        params.append(status)
+    sql += " ORDER BY kind, path"
+    return [row_to_record(row) for row in conn.execute(sql, params)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index and search project artifacts")
+    parser.add_argument("--root", type=Path, default=Path.cwd(), help="Project root (default: cwd)")
+    parser.add_argument("--db", type=Path, help="Index database (default: under $XDG_CACHE_HOME/loaf/)")
+    # Also accepted after the command; SUPPRESS keeps the top-level value when it is not given there
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--root", type=Path, default=argparse.SUPPRESS, help="Project root (default: cwd)")
+    common.add_argument("--db", type=Path, default=argparse.SUPPRESS, help="Index database")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    commands.add_parser("update", parents=[common], help="Refresh the index")
+
+    search_parser = commands.add_parser("search", parents=[common], help="Full-text search")
+    search_parser.add_argument("query", help="FTS5 query, e.g. 'sqlite AND migration'")
+    search_parser.add_argument("--kind", choices=sorted(ARTIFACT_KINDS))
+    search_parser.add_argument("--limit", type=int, default=20)
+    search_parser.add_argument("--no-refresh", action="store_true", help="Query the index as is")
+
+    list_parser = commands.add_parser("list", parents=[common], help="List indexed artifacts")
+    list_parser.add_argument("--kind", choices=sorted(ARTIFACT_KINDS))
+    list_parser.add_argument("--status")
+    list_parser.add_argument("--no-refresh", action="store_true", help="Query the index as is")
+
+    args = parser.parse_args()
+    root = args.root.resolve()
+    if not root.is_dir():
+        print(f"Error: Directory not found: {args.root}", file=sys.stderr)
+        sys.exit(1)
+
+    conn = open_db(args.db or default_db_path(root))
+
+    if args.command == "update":
+        result = update_index(conn, root)
+    else:
+        if not args.no_refresh:
+            update_index(conn, root)
+        if args.command == "search":
+            result = search(conn, args.query, args.kind, args.limit)
+        else:
+            result = list_artifacts(conn, args.kind, args.status)
+
+    conn.close()
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,106 +1,1840 @@
 #!/usr/bin/env python3
 """Validate Kubernetes manifest for best practices.
 
-Usage: validate-k8s-manifest.py <manifest.yaml>
+Usage:
+    validate-k8s-manifest.py <manifest.yaml>
+    validate-k8s-manifest.py <file|dir|glob>... [--format text|ndjson|sarif] [--jobs N] [--cross-refs]
+                             [--schema swagger.json] [--rules policy.yaml]
+                             [--cache-dir DIR | --no-cache]
+
+The file is memory-mapped and split into document byte ranges; each
+document is decoded and parsed on its own by a small stdlib loader for the
+YAML that kubectl, Helm and Kustomize emit, so memory stays bounded by the
+largest document rather than the whole bundle.
+
+Checks are declarative rules (BUILTIN_RULES): a kind filter, a scope
+(document, pod spec, or each container), a field path, a predicate the
+value must satisfy, and a message. They are compiled once into a table
+keyed by kind, so a document only meets the rules for its kind. --rules
+adds org policies from a YAML or JSON file and can disable built-ins:
+
+    disable: [probes]
+    rules:
+      - id: no-host-network
+        scope: pod
+        path: hostNetwork
+        predicate: {present: false}
+        message: hostNetwork is not allowed
+
+Directories (*.yaml, *.yml) and globs expand to many files. Files are
+split into ~1 MiB runs of whole documents and validated on a process
+pool; findings are merged back in file and line order.
+
+--cross-refs treats every input as one bundle. Workers also return a small
+index record per Service, workload, ConfigMap, Secret, ServiceAccount and
+Ingress; the main process joins them on (kind, namespace, name) and pod
+template labels to report missing ConfigMap/Secret/ServiceAccount references,
+Service selectors that match no pod template, and unreferenced Secrets.
+
+--schema checks each document against the definition for its apiVersion and
+kind in a vendored OpenAPI file (e.g. the cluster version's swagger.json),
+reporting unknown fields such as a misspelt readinessProbe, type mismatches
+and missing required fields. No cluster is contacted. The file is compiled to
+a compact node table cached under $XDG_CACHE_HOME/loaf/, keyed by its content
+hash, so later runs skip the compile. Kinds the file lacks (CRDs) are skipped.
+
+Findings are cached per document in a SQLite file under $XDG_CACHE_HOME/loaf/
+(or --cache-dir), keyed by the document's normalized bytes, a hash of this
+script and the schema and rules in use. Unchanged documents are neither
+parsed nor checked again; the least recently used results are evicted past
+a fixed size. A cache directory that cannot be written is skipped, and
+--no-cache validates everything from scratch.
 """
 
-import sys
+import argparse
+import glob
+import hashlib
+import json
+import mmap
+import os
 import re
+import sqlite3
+import stat
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional, Union
 
 
-def validate_pod_spec(text: str, path: str) -> list[str]:
-    """Validate pod spec for security and resource settings."""
-    errors = []
+class ManifestError(ValueError):
+    """A document that is not valid YAML (for the supported subset)."""
 
-    if not re.search(r"(?m)^\s*runAsNonRoot:\s*true\s*(?:#.*)?$", text):
-        errors.append(f"{path}: Missing runAsNonRoot: true")
+    def __init__(self, line: int, message: str):
+        super().__init__(f"line {line}: {message}")
+        self.line = line
+        self.message = message
 
-    if "containers:" not in text:
-        return errors
 
-    container_path = f"{path}.containers"
-    for required in ["resources:", "requests:", "limits:", "livenessProbe:", "readinessProbe:"]:
-        if required not in text:
-            errors.append(f"{container_path}: Missing {required.rstrip(':')}")
+# ---------------------------------------------------------------------------
+# YAML loading
+# ---------------------------------------------------------------------------
 
-    for image in re.findall(r"(?m)^\s*image:\s*([^\s#]+)", text):
-        if ":latest" in image or ":" not in image:
-            errors.append(f"{container_path}: Using :latest or no tag for image")
+DOCUMENT_MARKER = re.compile(rb"^(---|\.\.\.)([ \t][^\n]*)?\r?$", re.M)
+COMMENT = re.compile(r"(?:^|[ \t])#")
+PLAIN_INT = re.compile(r"[-+]?(?:0|[1-9][0-9_]*)$")
+PLAIN_BASED_INT = re.compile(r"0x[0-9a-fA-F_]+$|0o[0-7_]+$")
+PLAIN_FLOAT = re.compile(r"[-+]?(?:(?:\.[0-9]+|[0-9][0-9_]*\.[0-9_]*)(?:[eE][-+]?[0-9]+)?|[0-9][0-9_]*[eE][-+]?[0-9]+)$")
+QUOTED_SCALAR = {
+    "'": re.compile(r"'[^']*(?:''[^']*)*'(?!')"),
+    '"': re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S),
+}
+# The rest of a quoted scalar that continues from a previous line, up to its closing quote
+QUOTED_TAIL = {
+    "'": re.compile(r"[^']*(?:''[^']*)*'(?!')"),
+    '"': re.compile(r'[^"\\]*(?:\\.[^"\\]*)*"', re.S),
+}
+DOUBLE_QUOTED_ESCAPE = re.compile(r"\\(x[0-9a-fA-F]{2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8}|.)")
 
-    if not re.search(r"(?m)^\s*allowPrivilegeEscalation:\s*false\s*(?:#.*)?$", text):
-        errors.append(f"{container_path}: Missing allowPrivilegeEscalation: false")
+PLAIN_CONSTANTS = {
+    "": None, "~": None, "null": None, "Null": None, "NULL": None,
+    "true": True, "True": True, "TRUE": True,
+    "false": False, "False": False, "FALSE": False,
+    ".inf": float("inf"), ".Inf": float("inf"), "+.inf": float("inf"),
+    "-.inf": float("-inf"), "-.Inf": float("-inf"),
+    ".nan": float("nan"), ".NaN": float("nan"),
+}
 
-    return errors
+ESCAPES = {
+    "0": "\0", "a": "\a", "b": "\b", "t": "\t", "\t": "\t", "n": "\n", "v": "\v",
+    "f": "\f", "r": "\r", "e": "\x1b", " ": " ", '"': '"', "/": "/", "\\": "\\",
+    "N": "\x85", "_": "\xa0", "L": " ", "P": " ",
+}
 
 
-def field_value(text: str, field: str, default: str = "Unknown") -> str:
-    match = re.search(rf"(?m)^\s*{re.escape(field)}:\s*([^\s#]+)", text)
-    if not match:
-        return default
-    return match.group(1).strip().strip('"\'')
+def strip_comment(text: str) -> str:
+    """Drop a trailing comment, leaving `#` inside quoted scalars alone."""
+    if "#" not in text:
+        return text
+    if "'" not in text and '"' not in text:
+        match = COMMENT.search(text)
+        return text[:match.start()] if match else text
 
+    quote = None
+    at_scalar_start = True
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if quote == '"':
+            if ch == "\\":
+                i += 1
+            elif ch == '"':
+                quote = None
+        elif quote == "'":
+            if ch == "'":
+                if text[i + 1:i + 2] == "'":
+                    i += 1
+                else:
+                    quote = None
+        elif ch == "#" and (i == 0 or text[i - 1] in " \t"):
+            return text[:i]
+        elif ch not in " \t":
+            if ch in "'\"" and at_scalar_start:
+                quote = ch
+            at_scalar_start = starts_scalar(text, i)
+        i += 1
+    return text
+
+
+def starts_scalar(text: str, i: int) -> bool:
+    """Whether the indicator at text[i] can be followed by a quoted scalar."""
+    ch = text[i]
+    if ch in "[{,":
+        return True
+    return ch in ":-?" and text[i + 1:i + 2] in ("", " ", "\t")
+
+
+def quoted_end(text: str) -> int:
+    """Index of the quote closing the scalar that opens `text`, or -1."""
+    match = QUOTED_SCALAR[text[0]].match(text)
+    return match.end() - 1 if match else -1
+
+
+def unquote(text: str) -> str:
+    """Decode a complete single- or double-quoted scalar."""
+    body = text[1:-1]
+    if text[0] == "'":
+        return body.replace("''", "'")
+
+    def escape(match: re.Match) -> str:
+        code = match.group(1)
+        if code[0] in "xuU" and len(code) > 1:
+            return chr(int(code[1:], 16))
+        return ESCAPES.get(code, code)
+
+    return DOUBLE_QUOTED_ESCAPE.sub(escape, body)
+
+
+def resolve_plain(text: str) -> Any:
+    """Resolve a plain scalar to null, bool, int, float or str (YAML 1.2 core)."""
+    if text in PLAIN_CONSTANTS:
+        return PLAIN_CONSTANTS[text]
+    first = text[0]
+    if first.isdigit() or first in "+-.":
+        if PLAIN_INT.match(text):
+            return int(text.replace("_", ""))
+        if PLAIN_BASED_INT.match(text):
+            return int(text.replace("_", ""), 0)
+        if PLAIN_FLOAT.match(text):
+            return float(text.replace("_", ""))
+    return text
+
+
+def split_key(text: str) -> Optional[tuple[str, str]]:
+    """Split `key: value` into its key and the raw value text."""
+    first = text[0]
+    if first in "'\"":
+        end = quoted_end(text)
+        if end == -1:
+            return None
+        after = text[end + 1:].lstrip()
+        if after[:1] == ":" and (len(after) == 1 or after[1] in " \t"):
+            return unquote(text[:end + 1]), after[1:].lstrip()
+        return None
+    if first in "[{&*!|>%@`" or first == "?" and text[1:2] in ("", " ", "\t"):
+        return None
+    index = text.find(": ")
+    if index == -1:
+        index = text.find(":\t")
+    if index == -1:
+        return (text[:-1].rstrip(), "") if text.endswith(":") else None
+    return text[:index].rstrip(), text[index + 2:].lstrip()
+
+
+def is_sequence_item(text: str) -> bool:
+    """Whether a line's content is a block sequence entry (`-` or `- ...`)."""
+    return text == "-" or text.startswith("- ")
+
+
+def scan_flow(text: str) -> tuple[int, Optional[str]]:
+    """Net count of unclosed flow brackets, and the quote left open at the end, if any."""
+    depth = 0
+    quote = None
+    at_scalar_start = True
+    i = 0
+    while i < len(text):
+        ch = text[i]
+        if quote:
+            if ch == "\\" and quote == '"':
+                i += 1
+            elif ch == quote:
+                if quote == "'" and text[i + 1:i + 2] == "'":
+                    i += 1
+                else:
+                    quote = None
+        elif ch not in " \t":
+            if ch in "'\"" and at_scalar_start:
+                quote = ch
+            elif ch in "[{":
+                depth += 1
+            elif ch in "]}":
+                depth -= 1
+            at_scalar_start = starts_scalar(text, i)
+        i += 1
+    return depth, quote
+
+
+def fold_quoted_line(parts: list[str], continuation: str, quote: str) -> None:
+    """Append the next line of a multi-line quoted scalar, applying YAML line folding."""
+    last = parts[-1]
+    if quote == '"' and (len(last) - len(last.rstrip("\\"))) % 2 == 1:
+        # An escaped line break joins the lines without a space
+        parts[-1] = last[:-1]
+    elif not continuation:
+        parts.append("\n")
+    elif not last.endswith("\n"):
+        parts.append(" ")
+    if continuation:
+        parts.append(continuation)
+
+
+def parse_flow(text: str, line: int) -> Any:
+    """Parse a flow collection such as `[a, b]` or `{a: 1}`."""
+
+    def skip(i: int) -> int:
+        while i < len(text) and text[i] in " \t":
+            i += 1
+        return i
+
+    def node(i: int, in_map_key: bool = False) -> tuple[Any, int]:
+        i = skip(i)
+        if i >= len(text):
+            raise ManifestError(line, "unterminated flow collection")
+        ch = text[i]
+        if ch == "[":
+            items = []
+            i = skip(i + 1)
+            while text[i:i + 1] != "]":
+                item, i = node(i)
+                items.append(item)
+                i = skip(i)
+                if text[i:i + 1] == ",":
+                    i = skip(i + 1)
+                elif text[i:i + 1] != "]":
+                    raise ManifestError(line, "expected ',' or ']' in flow sequence")
+            return items, i + 1
+        if ch == "{":
+            mapping = {}
+            i = skip(i + 1)
+            while text[i:i + 1] != "}":
+                key, i = node(i, in_map_key=True)
+                i = skip(i)
+                value = None
+                if text[i:i + 1] == ":":
+                    i = skip(i + 1)
+                    if text[i:i + 1] not in (",", "}"):
+                        value, i = node(i)
+                        i = skip(i)
+                mapping[key] = value
+                if text[i:i + 1] == ",":
+                    i = skip(i + 1)
+                elif text[i:i + 1] != "}":
+                    raise ManifestError(line, "expected ',' or '}' in flow mapping")
+            return mapping, i + 1
+        if ch in "'\"":
+            end = quoted_end(text[i:])
+            if end == -1:
+                raise ManifestError(line, "unterminated quoted scalar")
+            return unquote(text[i:i + end + 1]), i + end + 1
+        start = i
+        while i < len(text):
+            ch = text[i]
+            if ch in ",]}":
+                break
+            if ch == ":" and (in_map_key or i + 1 == len(text) or text[i + 1] in " ,]}"):
+                break
+            i += 1
+        plain = text[start:i].strip()
+        return (plain if in_map_key else resolve_plain(plain)), i
+
+    value, end = node(0)
+    if skip(end) != len(text):
+        raise ManifestError(line, "unexpected text after flow collection")
+    return value
+
+
+class DocumentParser:
+    """Recursive-descent parser for one block-style YAML document."""
+
+    def __init__(self, raw_lines: list[str], first_line: int = 1):
+        # (line number, indent, comment-free content, raw text)
+        self.lines = []
+        # Positions of lines whose indentation holds a tab, which YAML forbids
+        self.tab_indented = set()
+        in_header = True
+        for offset, raw in enumerate(raw_lines):
+            if raw.endswith("\r"):
+                raw = raw[:-1]
+            stripped = raw.lstrip(" ")
+            indent = len(raw) - len(stripped)
+            content = strip_comment(stripped).strip() if stripped else ""
+            if in_header and content:
+                # %YAML / %TAG directives may precede the first document
+                if indent == 0 and content[0] == "%":
+                    content = ""
+                else:
+                    in_header = False
+            if content and stripped[0] == "\t":
+                self.tab_indented.add(offset)
+            self.lines.append((first_line + offset, indent, content, raw))
+        self.pos = 0
+        self.anchors: dict[str, Any] = {}
+
+    def peek(self) -> Optional[tuple]:
+        """Next non-blank line without consuming it."""
+        lines = self.lines
+        while self.pos < len(lines) and not lines[self.pos][2]:
+            self.pos += 1
+        if self.pos >= len(lines):
+            return None
+        # Block scalars and quoted or flow continuations read self.lines directly, where tabs are content
+        if self.pos in self.tab_indented:
+            raise ManifestError(lines[self.pos][0], "tab characters are not allowed in indentation")
+        return lines[self.pos]
+
+    def parse(self) -> Any:
+        line = self.peek()
+        if line is None:
+            return None
+        if is_sequence_item(line[2]) or split_key(line[2]) is not None:
+            value = self.parse_block(line[1])
+        else:
+            self.pos += 1
+            value = self.parse_value(line[2], -1, line[0])
+        leftover = self.peek()
+        if leftover is not None:
+            raise ManifestError(leftover[0], "unexpected content (check indentation)")
+        return value
+
+    def parse_block(self, indent: int) -> Any:
+        text = self.lines[self.pos][2]
+        if is_sequence_item(text):
+            return self.parse_sequence(indent)
+        return self.parse_mapping(indent)
+
+    def parse_mapping(self, indent: int) -> dict:
+        result: dict = {}
+        while True:
+            line = self.peek()
+            if line is None or line[1] != indent or is_sequence_item(line[2]):
+                return result
+            line_no, _, text, _ = line
+            entry = split_key(text)
+            if entry is None:
+                raise ManifestError(line_no, f"expected 'key: value', got {text[:40]!r}")
+            key, rest = entry
+            self.pos += 1
+            value = self.parse_value(rest, indent, line_no, compact_sequence=True)
+            if key == "<<":
+                for source in value if isinstance(value, list) else [value]:
+                    if isinstance(source, dict):
+                        for merged_key, merged_value in source.items():
+                            result.setdefault(merged_key, merged_value)
+            else:
+                result[key] = value
+
+    def parse_sequence(self, indent: int) -> list:
+        items = []
+        while True:
+            line = self.peek()
+            if line is None or line[1] != indent or not is_sequence_item(line[2]):
+                return items
+            line_no, _, text, raw = line
+            rest = text[1:].lstrip()
+            if rest and (is_sequence_item(rest) or split_key(rest) is not None):
+                # "- key: value" opens a nested collection at the item's column
+                offset = indent + len(text) - len(rest)
+                self.lines[self.pos] = (line_no, offset, rest, raw)
+                items.append(self.parse_block(offset))
+            else:
+                self.pos += 1
+                items.append(self.parse_value(rest, indent, line_no))
+
+    def parse_value(self, rest: str, parent_indent: int, line_no: int, compact_sequence: bool = False) -> Any:
+        """Parse the value that follows `key:` or `-` on a line."""
+        anchor = tag = None
+        pulled = False
+        while True:
+            while rest and rest[0] in "&!":
+                prop, _, rest = rest.partition(" ")
+                rest = rest.lstrip()
+                if prop[0] == "&":
+                    anchor = prop[1:]
+                else:
+                    tag = prop
+            if rest or pulled:
+                break
+            line = self.peek()
+            if (line is None or line[1] <= parent_indent or is_sequence_item(line[2])
+                    or split_key(line[2]) is not None):
+                break
+            # A scalar or flow collection may start on the line after its key
+            self.pos += 1
+            line_no, rest, pulled = line[0], line[2], True
+
+        if not rest:
+            line = self.peek()
+            if line is not None and line[1] > parent_indent:
+                value = self.parse_block(line[1])
+            elif (line is not None and compact_sequence and line[1] == parent_indent
+                  and is_sequence_item(line[2])):
+                value = self.parse_sequence(parent_indent)
+            else:
+                value = "" if tag == "!!str" else None
+        elif rest[0] == "*":
+            name = rest[1:]
+            if name not in self.anchors:
+                raise ManifestError(line_no, f"unknown alias *{name}")
+            value = self.anchors[name]
+        elif rest[0] in "|>":
+            value = self.parse_block_scalar(rest, parent_indent, line_no)
+        elif rest[0] in "[{":
+            parts = [rest]
+            depth, quote = scan_flow(rest)
+            while depth > 0:
+                if self.pos >= len(self.lines):
+                    raise ManifestError(line_no, "unterminated flow collection")
+                _, _, content, raw = self.lines[self.pos]
+                self.pos += 1
+                if quote:
+                    fold_quoted_line(parts, raw.strip(), quote)
+                elif content:
+                    parts.append(" " + content)
+                else:
+                    continue
+                depth, quote = scan_flow("".join(parts))
+            value = parse_flow("".join(parts), line_no)
+        elif rest[0] in "'\"":
+            value = self.parse_quoted(rest, line_no)
+        else:
+            if is_sequence_item(rest):
+                raise ManifestError(line_no, "sequence entries are not allowed here (put the item on its own line)")
+            if split_key(rest) is not None:
+                raise ManifestError(line_no, "mapping values are not allowed here (quote the value or nest it)")
+            text = rest
+            while True:
+                line = self.peek()
+                if line is None or line[1] <= parent_indent:
+                    break
+                if split_key(line[2]) is not None:
+                    raise ManifestError(line[0], "mapping values are not allowed in a plain scalar (check indentation)")
+                text += " " + line[2]
+                self.pos += 1
+            value = text if tag == "!!str" else resolve_plain(text)
+
+        if anchor:
+            self.anchors[anchor] = value
+        return value
+
+    def parse_quoted(self, text: str, line_no: int) -> str:
+        """Parse a quoted scalar, folding continuation lines if it spans several."""
+        quote = text[0]
+        closed = quoted_end(text) != -1
+        parts = [text]
+        while not closed:
+            if self.pos >= len(self.lines):
+                raise ManifestError(line_no, "unterminated quoted scalar")
+            continuation = self.lines[self.pos][3].strip()
+            fold_quoted_line(parts, continuation, quote)
+            closed = QUOTED_TAIL[quote].match(continuation) is not None
+            self.pos += 1
+        text = "".join(parts)
+        end = quoted_end(text)
+        if text[end + 1:].strip():
+            raise ManifestError(line_no, "unexpected text after quoted scalar")
+        return unquote(text[:end + 1])
+
+    def parse_block_scalar(self, header: str, parent_indent: int, line_no: int) -> str:
+        """Parse a literal (|) or folded (>) block scalar."""
+        chomp = "clip"
+        content_indent = None
+        for ch in header[1:]:
+            if ch == "-":
+                chomp = "strip"
+            elif ch == "+":
+                chomp = "keep"
+            elif ch.isdigit():
+                content_indent = max(parent_indent, 0) + int(ch)
+            elif ch not in " \t":
+                raise ManifestError(line_no, f"invalid block scalar header {header!r}")
+
+        body = []
+        lines = self.lines
+        while self.pos < len(lines):
+            _, indent, _, raw = lines[self.pos]
+            if not raw.strip():
+                body.append("")
+                self.pos += 1
+                continue
+            if content_indent is None:
+                if indent <= parent_indent:
+                    break
+                content_indent = indent
+            elif indent < content_indent:
+                break
+            body.append(raw[content_indent:])
+            self.pos += 1
+
+        trailing = 0
+        while body and not body[-1]:
+            body.pop()
+            trailing += 1
+        if header[0] == "|":
+            text = "\n".join(body)
+        else:
+            parts = []
+            previous = None
+            empty = 0
+            for line in body:
+                if not line:
+                    empty += 1
+                    continue
+                if previous is None:
+                    parts.append("\n" * empty)
+                else:
+                    more_indented = line[0] in " \t" or previous[0] in " \t"
+                    parts.append("\n" * (empty + more_indented) if empty or more_indented else " ")
+                parts.append(line)
+                previous = line
+                empty = 0
+            text = "".join(parts)
+
+        if chomp == "strip" or not body and chomp == "clip":
+            return text
+        if chomp == "keep":
+            return text + "\n" * (trailing + bool(body))
+        return text + "\n"
+
+
+Buffer = Union[bytes, mmap.mmap]
+
+# Bytes of a mapped manifest to parse before returning the pages behind them
+RELEASE_CHUNK = 8 << 20
+
+
+def document_ranges(buffer: Buffer, start: int = 0, end: Optional[int] = None) -> Iterator[tuple[int, int]]:
+    """Yield the (start, end) byte range of each document between `---` / `...` markers.
+
+    `start` must be the beginning of a line; `end` defaults to the end of the buffer.
+    """
+    end = len(buffer) if end is None else end
+    for match in DOCUMENT_MARKER.finditer(buffer, start, end):
+        if match.start() > start:
+            yield start, match.start()
+        rest = match.group(2)
+        if match.group(1) == b"---" and rest and strip_comment(rest.decode("utf-8", "replace")).strip():
+            # Content on the marker line ("--- |") belongs to the document
+            start = match.start(2)
+        else:
+            start = match.end() + 1
+    if start < end:
+        yield start, end
+
+
+@contextmanager
+def open_manifest(path: Path) -> Iterator[Buffer]:
+    """Map a manifest file read-only; pipes and other non-regular files are read instead."""
+    with path.open("rb") as f:
+        info = os.fstat(f.fileno())
+        if not stat.S_ISREG(info.st_mode) or info.st_size == 0:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            if hasattr(buffer, "madvise"):
+                buffer.madvise(mmap.MADV_SEQUENTIAL)
+            yield buffer
+
+
+def load_document(lines: list[str], first_line: int = 1) -> Any:
+    """Parse one document's lines; None for documents with no content."""
+    return DocumentParser(lines, first_line).parse()
+
+
+def document_slices(
+    buffer: Buffer, start: int = 0, end: Optional[int] = None, first_line: int = 1
+) -> Iterator[tuple[int, bytes]]:
+    """Yield (line, raw bytes) per document range, releasing mapped pages already passed.
+
+    A byte range and the line number it starts on restrict the walk to one slice.
+    """
+    # Drop already-read pages of a mapped file so they do not count towards RSS
+    release = getattr(buffer, "madvise", None) if hasattr(mmap, "MADV_DONTNEED") else None
+    released = start - start % mmap.PAGESIZE
+
+    line = first_line
+    position = start
+    for start, end in document_ranges(buffer, start, end):
+        line += buffer[position:start].count(b"\n")
+        position = end
+        if release and start - released >= RELEASE_CHUNK:
+            boundary = start - start % mmap.PAGESIZE
+            release(mmap.MADV_DONTNEED, released, boundary - released)
+            released = boundary
+        raw = buffer[start:end]
+        yield line, raw
+        line += raw.count(b"\n")
+
+
+def parse_document(raw: bytes, line: int) -> Optional[tuple[int, Any]]:
+    """Parse one document's bytes into (first content line, document or ManifestError).
+
+    Returns None for documents with no content.
+    """
+    try:
+        text = raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        return line, ManifestError(line, f"not valid UTF-8 ({e.reason})")
+    parser = DocumentParser(text.split("\n"), line)
+    head = None
+    try:
+        head = parser.peek()
+        if head is None:
+            return None
+        return head[0], parser.parse()
+    except ManifestError as e:
+        return (head[0] if head else e.line), e
+
+
+def load_documents(
+    buffer: Buffer, start: int = 0, end: Optional[int] = None, first_line: int = 1
+) -> Iterator[tuple[int, Any]]:
+    """Yield (line, document) per non-empty document; parse errors are yielded, not raised.
+
+    Only the document being parsed is decoded, so memory beyond the
+    (file-backed) buffer stays bounded by the largest document.
+    """
+    for line, raw in document_slices(buffer, start, end, first_line):
+        parsed = parse_document(raw, line)
+        if parsed is not None:
+            yield parsed
+
+
+# ---------------------------------------------------------------------------
+# OpenAPI schemas
+# ---------------------------------------------------------------------------
+
+# Bump when the compiled node format changes to invalidate cached schemas
+SCHEMA_COMPILER_VERSION = 1
+
+# Definitions serialized as strings that manifests routinely write as numbers
+NUMERIC_STRING_DEFINITIONS = {"io.k8s.apimachinery.pkg.api.resource.Quantity"}
+
+JSON_TYPES = {dict: "object", list: "array", str: "string", bool: "boolean", int: "integer", float: "number"}
+
+# A node that accepts anything
+ANY_NODE = [None, None, None, True, []]
+
+
+def json_type(value: Any) -> str:
+    """The JSON Schema type name of a parsed value, e.g. "object" for a dict."""
+    return JSON_TYPES.get(type(value), type(value).__name__)
+
+
+def schema_definitions(spec: Any) -> dict:
+    """The named schemas of a Swagger 2.0, OpenAPI 3 or JSON Schema document."""
+    if isinstance(spec, dict):
+        for definitions in (spec.get("definitions"), dig(spec, "components", "schemas"), spec.get("$defs")):
+            if isinstance(definitions, dict):
+                return definitions
+    raise ValueError("no definitions, components.schemas or $defs found")
+
+
+def accepted_types(schema: dict, name: str) -> Optional[list[str]]:
+    """JSON types a schema accepts, or None when it does not say."""
+    if name in NUMERIC_STRING_DEFINITIONS:
+        return ["number", "string"]
+    if schema.get("format") == "int-or-string" or schema.get("x-kubernetes-int-or-string"):
+        return ["integer", "string"]
+    types = set()
+    for option in (schema, *(schema.get("oneOf") or []), *(schema.get("anyOf") or [])):
+        declared = option.get("type") if isinstance(option, dict) else None
+        types.update([declared] if isinstance(declared, str) else declared or [])
+    types.discard("null")
+    return sorted(types) or None
+
+
+def compile_schema(spec: Any) -> dict:
+    """Compile an OpenAPI document into per-kind roots over a shared node table.
+
+    A node is [types, properties, items, additional, required]: the accepted
+    JSON types (None for any), property name -> node id (None for free-form
+    objects), the node id of array items, whether unknown keys are allowed
+    (or the node id their values must match), and the required keys. Named
+    definitions keep their name as node id, so recursive schemas stay finite.
+    """
+    definitions = schema_definitions(spec)
+    nodes: dict[str, list] = {}
+
+    def compile_node(schema: Any, node_id: str) -> Optional[str]:
+        if not isinstance(schema, dict):
+            return None
+        ref = schema.get("$ref")
+        all_of = schema.get("allOf")
+        if ref is None and isinstance(all_of, list) and len(all_of) == 1 and isinstance(all_of[0], dict):
+            # OpenAPI 3 wraps a $ref in allOf to attach a default or description
+            ref = all_of[0].get("$ref")
+        if isinstance(ref, str):
+            name = ref.rsplit("/", 1)[-1]
+            if name not in nodes and isinstance(definitions.get(name), dict):
+                nodes[name] = ANY_NODE
+                nodes[name] = build_node(definitions[name], name)
+            return name if name in nodes else None
+        node = build_node(schema, node_id)
+        if node == ANY_NODE:
+            return None
+        nodes[node_id] = node
+        return node_id
+
+    def build_node(schema: dict, node_id: str) -> list:
+        if schema.get("x-kubernetes-preserve-unknown-fields"):
+            return ANY_NODE
+        properties = None
+        if isinstance(schema.get("properties"), dict):
+            properties = {
+                key: compile_node(child, f"{node_id}.{key}") for key, child in schema["properties"].items()
+            }
+        items = compile_node(schema.get("items"), f"{node_id}[]")
+        extra = schema.get("additionalProperties")
+        if isinstance(extra, dict):
+            additional = compile_node(extra, f"{node_id}{{}}") or True
+        else:
+            additional = properties is None or extra is True
+        return [accepted_types(schema, node_id), properties, items, additional, list(schema.get("required") or [])]
+
+    kinds: dict[str, dict[str, str]] = {}
+    for name, schema in definitions.items():
+        for gvk in (schema.get("x-kubernetes-group-version-kind") or []) if isinstance(schema, dict) else []:
+            api_version = f"{gvk['group']}/{gvk['version']}" if gvk.get("group") else gvk.get("version")
+            root = compile_node({"$ref": name}, name)
+            if api_version and gvk.get("kind") and root:
+                kinds.setdefault(api_version, {}).setdefault(gvk["kind"], root)
+    return {"kinds": kinds, "nodes": nodes}
+
+
+class SchemaValidator:
+    """Checks documents against a compiled schema, dispatched on apiVersion and kind."""
+
+    def __init__(self, compiled: dict, digest: str = ""):
+        self.kinds = compiled["kinds"]
+        self.nodes = compiled["nodes"]
+        self.digest = digest
+
+    def validate(self, doc: dict, path: str) -> list[tuple[str, str]]:
+        """Schema findings for one document; kinds the schema lacks (CRDs) pass."""
+        root = dig(self.kinds, str(doc.get("apiVersion")), str(doc.get("kind")))
+        errors: list[str] = []
+        if root:
+            self.check(doc, root, path, errors)
+        return [("schema", error) for error in errors]
+
+    def check(self, value: Any, node_id: Optional[str], path: str, errors: list[str]) -> None:
+        if value is None or node_id is None:
+            return
+        types, properties, items, additional, required = self.nodes[node_id]
+        actual = json_type(value)
+        if types and actual not in types and not (actual == "integer" and "number" in types):
+            errors.append(f"{path}: Expected {' or '.join(types)}, got {actual}")
+            return
+
+        if isinstance(value, dict):
+            for key in required:
+                if key not in value:
+                    errors.append(f"{path}: Missing required field {key}")
+            for key, child in value.items():
+                if properties is not None and key in properties:
+                    self.check(child, properties[key], f"{path}.{key}", errors)
+                elif isinstance(additional, str):
+                    self.check(child, additional, f"{path}.{key}", errors)
+                elif not additional:
+                    errors.append(f"{path}: Unknown field {key}")
+        elif isinstance(value, list) and items:
+            for index, item in enumerate(value):
+                name = item.get("name") if isinstance(item, dict) else None
+                self.check(item, items, f"{path}[{name if isinstance(name, str) and name else index}]", errors)
+
+
+_schemas: dict[str, SchemaValidator] = {}
+
+
+def default_schema_cache(digest: str) -> Path:
+    """Compiled schema cache under $XDG_CACHE_HOME/loaf/."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "loaf" / f"k8s-schema-{digest}.json"
+
+
+def load_schema(path: str) -> SchemaValidator:
+    """Load a vendored OpenAPI file, compiling it only when no cached build matches its content."""
+    if path not in _schemas:
+        data = Path(path).read_bytes()
+        digest = hashlib.sha256(data + f"\0{SCHEMA_COMPILER_VERSION}".encode()).hexdigest()[:16]
+        cache_path = default_schema_cache(digest)
+        try:
+            with open(cache_path) as f:
+                compiled = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            compiled = compile_schema(json.loads(data))
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+                with open(tmp_path, "w") as f:
+                    json.dump(compiled, f, separators=(",", ":"))
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # A read-only cache only costs a recompile next run
+        _schemas[path] = SchemaValidator(compiled, digest)
+    return _schemas[path]
+
+
+# ---------------------------------------------------------------------------
+# Checks
+# ---------------------------------------------------------------------------
+
+# kind -> field path from the document root to its pod spec
+POD_SPEC_PATHS = {
+    "Pod": ("spec",),
+    "Deployment": ("spec", "template", "spec"),
+    "StatefulSet": ("spec", "template", "spec"),
+    "DaemonSet": ("spec", "template", "spec"),
+    "ReplicaSet": ("spec", "template", "spec"),
+    "Job": ("spec", "template", "spec"),
+    "CronJob": ("spec", "jobTemplate", "spec", "template", "spec"),
+}
+
+
+def dig(node: Any, *keys: str) -> Any:
+    """Follow a path of mapping keys, returning None if any step is missing."""
+    for key in keys:
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+# Where a rule's field path starts, by scope
+RULE_SCOPES = ("document", "pod", "container", "app-container")
+
+# A digest, or a tag other than :latest on the last path segment. Each colon
+# only scans to the next ":" or "/", so matching stays linear on hostile input.
+PINNED_IMAGE = r"@|:(?!latest$)[^:/]*$"
+
+# Built-in policy. Each rule names a field path (`*` fans out over mapping
+# keys, `[]` over list items) under its scope, a predicate the value must
+# satisfy, and the message reported when it does not. Container rules run
+# for every container and init container; app-container rules skip init
+# containers other than restartPolicy: Always sidecars.
+BUILTIN_RULES = [
+    {
+        "id": "run-as-non-root",
+        "description": "Containers must run with runAsNonRoot: true",
+        "scope": "container",
+        "path": "securityContext.runAsNonRoot",
+        "fallback": "securityContext.runAsNonRoot",
+        "predicate": {"equals": True},
+        "message": "Missing runAsNonRoot: true",
+    },
+    {
+        "id": "resources",
+        "description": "Containers must declare resource requests and limits",
+        "scope": "container",
+        "path": "resources",
+        "predicate": {"type": "object"},
+        "message": "Missing resources",
+    },
+    {
+        "id": "resources",
+        "scope": "container",
+        "path": "resources.requests",
+        "when": {"path": "resources", "type": "object"},
+        "predicate": {"present": True},
+        "message": "Missing requests",
+    },
+    {
+        "id": "resources",
+        "scope": "container",
+        "path": "resources.limits",
+        "when": {"path": "resources", "type": "object"},
+        "predicate": {"present": True},
+        "message": "Missing limits",
+    },
+    {
+        "id": "probes",
+        "description": "Long-running containers need liveness and readiness probes",
+        "scope": "app-container",
+        "path": "livenessProbe",
+        "predicate": {"present": True},
+        "message": "Missing livenessProbe",
+    },
+    {
+        "id": "probes",
+        "scope": "app-container",
+        "path": "readinessProbe",
+        "predicate": {"present": True},
+        "message": "Missing readinessProbe",
+    },
+    {
+        "id": "image-tag",
+        "description": "Images must be pinned to a digest or a tag other than :latest",
+        "scope": "container",
+        "path": "image",
+        "predicate": {"type": "string", "present": True},
+        "message": "Missing image",
+    },
+    {
+        "id": "image-tag",
+        "scope": "container",
+        "path": "image",
+        "when": {"type": "string", "present": True},
+        "predicate": {"matches": PINNED_IMAGE},
+        "message": "Using :latest or no tag for image",
+    },
+    {
+        "id": "allow-privilege-escalation",
+        "description": "Containers must set allowPrivilegeEscalation: false",
+        "scope": "container",
+        "path": "securityContext.allowPrivilegeEscalation",
+        "predicate": {"equals": False},
+        "message": "Missing allowPrivilegeEscalation: false",
+    },
+    {
+        "id": "secret-string-data",
+        "description": "Secrets should not carry sensitive values in stringData",
+        "kinds": ["Secret"],
+        "scope": "document",
+        "path": "stringData.*",
+        "subject": "key",
+        "predicate": {"not_matches": "(?i)PASSWORD|KEY|TOKEN"},
+        "message": "Sensitive data in stringData key {key} (use data with base64)",
+    },
+]
+
+PREDICATE_KEYS = ("equals", "present", "type", "matches", "not_matches")
+
+
+@dataclass
+class Rule:
+    """One compiled policy rule: which kinds and scope it applies to, and the field predicate it enforces."""
+
+    id: str
+    kinds: Optional[frozenset[str]]
+    scope: str
+    path: tuple[str, ...]
+    predicate: dict[str, Any]
+    message: str
+    subject: str = "value"
+    fallback: Optional[tuple[str, ...]] = None
+    when: Optional[tuple[tuple[str, ...], dict[str, Any]]] = None
+
+    def check(self, node: Any, parent: Any, path: str) -> Iterator[tuple[str, str]]:
+        """Yield a (rule id, message) finding for each value under `node` that fails the predicate.
+
+        `parent` is the pod spec for container rules; fallback paths read from it.
+        """
+        for key, value in resolve_field(node, self.path):
+            if value is None and self.fallback:
+                value = dig(parent, *self.fallback)
+            if self.when and not holds(self.when[1], dig(node, *self.when[0]) if self.when[0] else value):
+                continue
+            if not holds(self.predicate, str(key) if self.subject == "key" else value):
+                yield self.id, f"{path}: {self.message.format(key=key, value=value)}"
+
+
+@dataclass
+class Policy:
+    """The compiled rule set, indexed by kind, with the content digest used to salt cached results."""
+
+    rules: list[Rule]
+    descriptions: dict[str, str]
+    # kind -> scope bucket ("document", "pod", "container") -> rules in declaration order
+    by_kind: dict[str, dict[str, list[Rule]]]
+    digest: str = ""
+
+    def for_kind(self, kind: str) -> dict[str, list[Rule]]:
+        """Rules for a kind by scope; kinds no rule names get the `*` bucket."""
+        return self.by_kind.get(kind) or self.by_kind["*"]
+
+
+def resolve_field(node: Any, path: tuple[str, ...], key: Any = None) -> Iterator[tuple[Any, Any]]:
+    """Yield (key, value) for each match of a field path; missing fields yield None once.
+
+    The key is the innermost `*` mapping key or `[]` list index on the way.
+    """
+    if not path:
+        yield key, node
+        return
+    head, rest = path[0], path[1:]
+    if head == "*":
+        if isinstance(node, dict):
+            for child_key, child in node.items():
+                yield from resolve_field(child, rest, child_key)
+    elif head == "[]":
+        if isinstance(node, list):
+            for index, child in enumerate(node):
+                yield from resolve_field(child, rest, index)
+    else:
+        yield from resolve_field(node.get(head) if isinstance(node, dict) else None, rest, key)
+
+
+def holds(predicate: dict[str, Any], value: Any) -> bool:
+    """True when a value satisfies every condition of a compiled predicate."""
+    if "equals" in predicate:
+        expected = predicate["equals"]
+        # `is`-style equality: 1 must not satisfy `equals: true`
+        if type(value) is not type(expected) or value != expected:
+            return False
+    if "present" in predicate and bool(value) != predicate["present"]:
+        return False
+    if "type" in predicate and json_type(value) != predicate["type"]:
+        return False
+    if "matches" in predicate and not (isinstance(value, str) and predicate["matches"].search(value)):
+        return False
+    if "not_matches" in predicate and isinstance(value, str) and predicate["not_matches"].search(value):
+        return False
+    return True
+
+
+def compile_predicate(spec: Any, where: str) -> dict[str, Any]:
+    """Validate a predicate mapping and precompile its patterns; `where` prefixes errors."""
+    if not isinstance(spec, dict) or not any(key in spec for key in PREDICATE_KEYS):
+        raise ValueError(f"{where}: predicate needs one of {', '.join(PREDICATE_KEYS)}")
+    predicate = {key: spec[key] for key in PREDICATE_KEYS if key in spec}
+    for key in ("matches", "not_matches"):
+        if key in predicate:
+            try:
+                predicate[key] = re.compile(str(predicate[key]))
+            except re.error as e:
+                raise ValueError(f"{where}: invalid {key} pattern: {e}") from None
+    return predicate
+
+
+def compile_path(text: Any, where: str, wildcards: bool = True) -> tuple[str, ...]:
+    """Split a dotted field path, rejecting `*` and `[]` segments unless wildcards are allowed."""
+    if not isinstance(text, str) or not text:
+        raise ValueError(f"{where}: path must be a non-empty string")
+    path = tuple(text.split("."))
+    if not wildcards and any(part in ("*", "[]") for part in path):
+        raise ValueError(f"{where}: path {text} cannot use * or []")
+    return path
+
+
+def compile_rule(spec: Any, index: int) -> Rule:
+    """Validate one rule definition and precompile its paths, predicates and patterns."""
+    where = f"rule {index + 1}"
+    if not isinstance(spec, dict):
+        raise ValueError(f"{where}: must be a mapping")
+    if not spec.get("id") or not spec.get("message"):
+        raise ValueError(f"{where}: id and message are required")
+    where = f"rule {spec['id']}"
+    scope = spec.get("scope", "document")
+    if scope not in RULE_SCOPES:
+        raise ValueError(f"{where}: scope must be one of {', '.join(RULE_SCOPES)}")
+    kinds = spec.get("kinds")
+    if kinds is not None and not (isinstance(kinds, list) and all(isinstance(k, str) for k in kinds)):
+        raise ValueError(f"{where}: kinds must be a list of kind names")
+    subject = spec.get("subject", "value")
+    if subject not in ("value", "key"):
+        raise ValueError(f"{where}: subject must be value or key")
+    try:
+        str(spec["message"]).format(key="", value="")
+    except (KeyError, IndexError, ValueError) as e:
+        raise ValueError(f"{where}: message may only use {{key}} and {{value}} ({e})") from None
+
+    when = None
+    if spec.get("when") is not None:
+        guard = spec["when"]
+        guard_path = compile_path(guard["path"], where, wildcards=False) if isinstance(guard, dict) and "path" in guard else ()
+        when = (guard_path, compile_predicate(guard, f"{where} when"))
+    return Rule(
+        id=str(spec["id"]),
+        kinds=frozenset(kinds) if kinds is not None else None,
+        scope=scope,
+        path=compile_path(spec.get("path"), where),
+        predicate=compile_predicate(spec.get("predicate"), where),
+        message=str(spec["message"]),
+        subject=subject,
+        fallback=compile_path(spec["fallback"], where, wildcards=False) if spec.get("fallback") else None,
+        when=when,
+    )
+
+
+def compile_policy(specs: list, disabled: Iterable[str] = (), digest: str = "") -> Policy:
+    """Compile rule definitions into a dispatch table keyed by kind.
+
+    Each kind gets only the rules that name it (or name no kinds) and that
+    fit it: pod and container rules apply to kinds with a pod spec. Kinds
+    with no entry share the "*" entry of kind-agnostic document rules.
+    """
+    disabled = set(disabled)
+    rules = [rule for rule in (compile_rule(spec, i) for i, spec in enumerate(specs)) if rule.id not in disabled]
+    descriptions = {}
+    for spec in specs:
+        if isinstance(spec, dict) and spec["id"] not in disabled:
+            descriptions.setdefault(spec["id"], spec.get("description") or spec["message"])
+
+    def bucket(kind: Optional[str]) -> dict[str, list[Rule]]:
+        scopes = {"document": [], "pod": [], "container": []}
+        for rule in rules:
+            if rule.kinds is not None and kind not in rule.kinds:
+                continue
+            if rule.scope == "document":
+                scopes["document"].append(rule)
+            elif kind in POD_SPEC_PATHS:
+                scopes["pod" if rule.scope == "pod" else "container"].append(rule)
+        return scopes
+
+    named = set(POD_SPEC_PATHS).union(*(rule.kinds for rule in rules if rule.kinds))
+    by_kind = {kind: bucket(kind) for kind in named}
+    by_kind["*"] = bucket(None)
+    return Policy(rules, descriptions, by_kind, digest)
 
-def secret_string_data_keys(text: str) -> list[str]:
-    match = re.search(r"(?ms)^stringData:\s*\n(?P<body>(?:^[ \t]+[A-Za-z0-9_.-]+:\s*.*\n?)+)", text)
-    if not match:
-        return []
-    return re.findall(r"(?m)^\s+([A-Za-z0-9_.-]+):", match.group("body"))
 
+def rules_digest(specs: list) -> str:
+    """Stable hash of rule definitions, for cache keys."""
+    return hashlib.sha256(json.dumps(specs, sort_keys=True).encode()).hexdigest()[:16]
 
-def manifest_documents(text: str) -> list[str]:
-    return [doc.strip() for doc in re.split(r"(?m)^---\s*$", text) if doc.strip()]
 
+DEFAULT_POLICY = compile_policy(BUILTIN_RULES, digest=rules_digest(BUILTIN_RULES))
+
+_policies: dict[tuple[str, ...], Policy] = {}
+
+
+def load_policy(paths: tuple[str, ...]) -> Policy:
+    """The built-in rules plus those in each rules file (YAML or JSON).
+
+    A rules file holds a list of rules, or a mapping with `rules` and a
+    `disable` list of rule ids to switch off (built-in or earlier files).
+    """
+    if not paths:
+        return DEFAULT_POLICY
+    if paths not in _policies:
+        specs = list(BUILTIN_RULES)
+        disabled: list[str] = []
+        digest = hashlib.sha256(DEFAULT_POLICY.digest.encode())
+        for path in paths:
+            data = Path(path).read_bytes()
+            digest.update(data)
+            with open_manifest(Path(path)) as buffer:
+                loaded = next(load_documents(buffer), (1, None))[1]
+            if isinstance(loaded, ManifestError):
+                raise ValueError(f"{path}: {loaded}")
+            if isinstance(loaded, dict) and not loaded.keys() & {"rules", "disable"}:
+                raise ValueError(f"{path}: expected a list of rules or a mapping with rules")
+            if isinstance(loaded, dict):
+                disabled.extend(str(rule_id) for rule_id in loaded.get("disable") or [])
+                loaded = loaded.get("rules") or []
+            if not isinstance(loaded, list):
+                raise ValueError(f"{path}: expected a list of rules or a mapping with rules")
+            specs.extend(loaded)
+        _policies[paths] = compile_policy(specs, disabled, digest.hexdigest()[:16])
+    return _policies[paths]
+
+
+def validate_pod_spec(spec: Any, path: str, rules: dict[str, list[Rule]]) -> list[tuple[str, str]]:
+    """Apply pod and container rules to a pod spec, every container and init container."""
+    if not isinstance(spec, dict):
+        return [("manifest", f"{path}: Missing pod spec")]
+
+    containers = spec.get("containers")
+    if not isinstance(containers, list) or not containers:
+        return [("manifest", f"{path}: Missing containers")]
+
+    errors = [error for rule in rules["pod"] for error in rule.check(spec, spec, path)]
+    init_containers = spec.get("initContainers")
+    groups = [("containers", containers)]
+    if isinstance(init_containers, list):
+        groups.append(("initContainers", init_containers))
+
+    for field, entries in groups:
+        for index, container in enumerate(entries):
+            name = container.get("name") if isinstance(container, dict) else None
+            container_path = f"{path}.{field}[{name or index}]"
+            if not isinstance(container, dict):
+                errors.append(("manifest", f"{container_path}: Container is not a mapping"))
+                continue
+            # Init containers only count as long-running when they run as sidecars
+            long_running = field == "containers" or container.get("restartPolicy") == "Always"
+            for rule in rules["container"]:
+                if rule.scope == "app-container" and not long_running:
+                    continue
+                errors.extend(rule.check(container, spec, container_path))
+    return errors
+
+
+def validate_manifest(
+    doc: Any, schema: Optional[SchemaValidator] = None, policy: Policy = DEFAULT_POLICY
+) -> list[tuple[str, str]]:
+    """Validate a single parsed Kubernetes manifest against the policy rules for its kind.
+
+    Also checks it against the schema when one is given. Returns (rule id,
+    message) findings.
+    """
+    if not isinstance(doc, dict):
+        return [("manifest", "Document is not a mapping")]
 
-def validate_manifest(doc: str) -> list[str]:
-    """Validate a single Kubernetes manifest."""
     errors = []
-    kind = field_value(doc, "kind")
-    name = field_value(doc, "name", "unnamed")
+    kind = doc.get("kind") or "Unknown"
+    name = dig(doc, "metadata", "name") or "unnamed"
     path = f"{kind}/{name}"
 
-    if kind in {"Deployment", "StatefulSet"}:
-        errors.extend(validate_pod_spec(doc, f"{path}.spec.template.spec"))
-    elif kind == "CronJob":
-        errors.extend(validate_pod_spec(doc, f"{path}.spec.jobTemplate.spec.template.spec"))
-    elif kind == "Pod":
-        errors.extend(validate_pod_spec(doc, f"{path}.spec"))
-    elif kind == "Secret":
-        for key in secret_string_data_keys(doc):
-            if any(sensitive in key.upper() for sensitive in ["PASSWORD", "KEY", "TOKEN"]):
-                errors.append(f"{path}: Sensitive data in stringData (use data with base64)")
+    if kind == "List":
+        for item in doc.get("items") or []:
+            errors.extend(validate_manifest(item, schema, policy))
+        return errors
+
+    if schema is not None:
+        errors.extend(schema.validate(doc, path))
+    rules = policy.for_kind(str(kind))
+    if kind in POD_SPEC_PATHS:
+        spec_path = POD_SPEC_PATHS[kind]
+        errors.extend(validate_pod_spec(dig(doc, *spec_path), f"{path}.{'.'.join(spec_path)}", rules))
+    for rule in rules["document"]:
+        errors.extend(rule.check(doc, doc, path))
     return errors
 
 
+# ---------------------------------------------------------------------------
+# Cross-document references
+# ---------------------------------------------------------------------------
+
+# Kinds whose documents feed the bundle index
+INDEXED_KINDS = {"Service", "ConfigMap", "Secret", "ServiceAccount", "Ingress", *POD_SPEC_PATHS}
+
+# Secret types that are consumed by the control plane rather than referenced by name
+CONTROLLER_SECRET_TYPES = {"kubernetes.io/service-account-token"}
+
+
+def label_value(value: Any) -> str:
+    """Render a label or selector value the way the API server stores it."""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def pod_spec_refs(spec: Any) -> list[tuple[str, str]]:
+    """Collect the (kind, name) objects a pod spec needs, skipping optional references."""
+    if not isinstance(spec, dict):
+        return []
+
+    refs = []
+
+    def add(kind: str, source: Any, field: str = "name") -> None:
+        if isinstance(source, dict) and source.get(field) and source.get("optional") is not True:
+            refs.append((kind, str(source[field])))
+
+    for volume in spec.get("volumes") or []:
+        if not isinstance(volume, dict):
+            continue
+        add("ConfigMap", volume.get("configMap"))
+        add("Secret", volume.get("secret"), "secretName")
+        for source in dig(volume, "projected", "sources") or []:
+            if isinstance(source, dict):
+                add("ConfigMap", source.get("configMap"))
+                add("Secret", source.get("secret"))
+
+    for field in ("containers", "initContainers", "ephemeralContainers"):
+        for container in spec.get(field) or []:
+            if not isinstance(container, dict):
+                continue
+            for source in container.get("envFrom") or []:
+                if isinstance(source, dict):
+                    add("ConfigMap", source.get("configMapRef"))
+                    add("Secret", source.get("secretRef"))
+            for var in container.get("env") or []:
+                value_from = var.get("valueFrom") if isinstance(var, dict) else None
+                if isinstance(value_from, dict):
+                    add("ConfigMap", value_from.get("configMapKeyRef"))
+                    add("Secret", value_from.get("secretKeyRef"))
+
+    for secret in spec.get("imagePullSecrets") or []:
+        add("Secret", secret)
+
+    account = spec.get("serviceAccountName") or spec.get("serviceAccount")
+    if account and account != "default":
+        refs.append(("ServiceAccount", str(account)))
+    return refs
+
+
+def index_document(doc: Any) -> list[dict]:
+    """Reduce a manifest to the facts the bundle checks join on.
+
+    Each record carries kind, namespace and name, the pod template labels of
+    workloads, the selector of Services, the Secret type, and the (kind, name)
+    objects the document references. Records are small enough to ship back
+    from pool workers instead of the documents themselves.
+    """
+    if not isinstance(doc, dict):
+        return []
+    kind = doc.get("kind")
+    if kind == "List":
+        return [record for item in doc.get("items") or [] for record in index_document(item)]
+    if kind not in INDEXED_KINDS:
+        return []
+
+    record = {
+        "kind": kind,
+        "namespace": str(dig(doc, "metadata", "namespace") or "default"),
+        "name": str(dig(doc, "metadata", "name") or "unnamed"),
+        "refs": [],
+    }
+    if kind in POD_SPEC_PATHS:
+        spec_path = POD_SPEC_PATHS[kind]
+        labels = dig(doc, *spec_path[:-1], "metadata", "labels")
+        record["labels"] = {str(k): label_value(v) for k, v in labels.items()} if isinstance(labels, dict) else {}
+        record["refs"] = pod_spec_refs(dig(doc, *spec_path))
+    elif kind == "Service":
+        selector = dig(doc, "spec", "selector")
+        if isinstance(selector, dict) and dig(doc, "spec", "type") != "ExternalName":
+            record["selector"] = {str(k): label_value(v) for k, v in selector.items()}
+    elif kind == "Secret":
+        record["type"] = doc.get("type") or "Opaque"
+    elif kind == "ServiceAccount":
+        for field in ("secrets", "imagePullSecrets"):
+            for secret in doc.get(field) or []:
+                if isinstance(secret, dict) and secret.get("name"):
+                    record["refs"].append(("Secret", str(secret["name"])))
+    elif kind == "Ingress":
+        for tls in dig(doc, "spec", "tls") or []:
+            if isinstance(tls, dict) and tls.get("secretName"):
+                record["refs"].append(("Secret", str(tls["secretName"])))
+    return [record]
+
+
+def cross_reference(records: Iterable[tuple[Any, int, dict]]) -> list[tuple[Any, int, str, str]]:
+    """Join bundle records on (kind, namespace, name) and pod template labels.
+
+    Takes (source, line, record) triples and returns (source, line, rule id,
+    message) findings. Every lookup is a dict or set probe, so the whole pass is linear
+    in the number of documents and references.
+    """
+    records = list(records)
+    defined = set()
+    # (namespace, label key, label value) -> label sets of the pod templates carrying it
+    templates: dict[tuple[str, str, str], list[dict]] = {}
+    for _, _, record in records:
+        defined.add((record["kind"], record["namespace"], record["name"]))
+        for key, value in record.get("labels", {}).items():
+            templates.setdefault((record["namespace"], key, value), []).append(record["labels"])
+
+    findings = []
+    referenced = set()
+    for source, line, record in records:
+        namespace = record["namespace"]
+        path = f"{record['kind']}/{record['name']}"
+        for kind, name in record["refs"]:
+            if kind == "Secret":
+                referenced.add((namespace, name))
+            if (kind, namespace, name) not in defined:
+                findings.append((
+                    source, line, "missing-reference", f"{path}: References missing {kind} {name} in namespace {namespace}"
+                ))
+
+        selector = record.get("selector")
+        if selector:
+            # Probe the rarest selector label, then confirm the rest on each candidate
+            candidates = min(
+                (templates.get((namespace, key, value), []) for key, value in selector.items()), key=len
+            )
+            if not any(all(labels.get(key) == value for key, value in selector.items()) for labels in candidates):
+                rendered = ",".join(f"{key}={value}" for key, value in selector.items())
+                findings.append((
+                    source, line, "orphan-selector",
+                    f"{path}: Selector {rendered} matches no pod template in namespace {namespace}",
+                ))
+
+    for source, line, record in records:
+        if (
+            record["kind"] == "Secret"
+            and record["type"] not in CONTROLLER_SECRET_TYPES
+            and (record["namespace"], record["name"]) not in referenced
+        ):
+            findings.append((
+                source, line, "unreferenced-secret",
+                f"Secret/{record['name']}: Unreferenced Secret in namespace {record['namespace']}",
+            ))
+    return findings
+
+
+# ---------------------------------------------------------------------------
+# Result cache
+# ---------------------------------------------------------------------------
+
+# Bump when checks, messages or index records change to invalidate cached results
+RESULT_CACHE_VERSION = 4
+# Least recently used results beyond this many are evicted after each run
+RESULT_CACHE_ENTRIES = 200_000
+
+RESULT_CACHE_FILE = "k8s-results.db"
+
+# Any edit to this script changes every key, so new code never serves old results
+VALIDATOR_DIGEST = hashlib.sha256(Path(__file__).read_bytes()).hexdigest()[:16]
+
+RESULT_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    key BLOB PRIMARY KEY,
+    result TEXT NOT NULL,
+    used INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS results_by_use ON results (used);
+"""
+
+_result_caches: dict[str, sqlite3.Connection] = {}
+
+
+def default_cache_dir() -> Path:
+    """Result cache directory under $XDG_CACHE_HOME/loaf/."""
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "loaf"
+
+
+def open_result_cache(cache_dir: Path) -> sqlite3.Connection:
+    """Open (creating) the cache for writing; WAL lets workers read while this process writes."""
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(cache_dir / RESULT_CACHE_FILE, timeout=30)
+    try:
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.executescript(RESULT_CACHE_SCHEMA)
+    except sqlite3.Error:
+        conn.close()
+        raise
+    return conn
+
+
+def result_key(raw: bytes, salt: bytes) -> bytes:
+    """Hash a document's bytes, ignoring CRLF line endings and trailing whitespace."""
+    return hashlib.sha256(salt + raw.replace(b"\r\n", b"\n").rstrip()).digest()
+
+
+def cached_result(cache_path: str, key: bytes) -> Optional[list]:
+    """Look a document up from a worker, on a connection opened once per process."""
+    if cache_path not in _result_caches:
+        _result_caches[cache_path] = sqlite3.connect(cache_path, timeout=30)
+    row = _result_caches[cache_path].execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+    return json.loads(row[0]) if row else None
+
+
+def store_results(conn: sqlite3.Connection, computed: list, reused: list, stamp: int) -> None:
+    """Record new results and mark reused ones as recently used (committed by the caller)."""
+    conn.executemany(
+        "INSERT OR REPLACE INTO results (key, result, used) VALUES (?, ?, ?)",
+        ((key, result, stamp) for key, result in computed),
+    )
+    conn.executemany("UPDATE results SET used = ? WHERE key = ?", ((stamp, key) for key in reused))
+
+
+def evict_results(conn: sqlite3.Connection, keep: int = RESULT_CACHE_ENTRIES) -> None:
+    """Drop all but the `keep` most recently used results."""
+    with conn:
+        conn.execute(
+            "DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY used DESC LIMIT -1 OFFSET ?)",
+            (keep,),
+        )
+
+
+# ---------------------------------------------------------------------------
+# Batch validation and reporting
+# ---------------------------------------------------------------------------
+
+# Target bytes of whole documents per unit of pool work
+CHUNK_BYTES = 1 << 20
+
+MANIFEST_SUFFIXES = ("*.yaml", "*.yml")
+
+# SARIF rule id -> description for findings outside the policy rules
+RULES = {
+    "yaml-syntax": "Documents must be valid YAML",
+    "missing-reference": "ConfigMaps, Secrets and ServiceAccounts a workload uses must be in the bundle",
+    "orphan-selector": "Service selectors must match a pod template in the bundle",
+    "unreferenced-secret": "Secrets in the bundle should be used by a workload, ServiceAccount or Ingress",
+    "schema": "Documents must match the Kubernetes OpenAPI schema for their kind",
+    "manifest": "Manifests must have the structure Kubernetes expects",
+}
+
+
+def collect_manifest_files(sources: list[str]) -> list[Path]:
+    """Expand directories (recursively, *.yaml / *.yml) and globs into a sorted file list."""
+    files = set()
+    for source in sources:
+        path = Path(source)
+        if path.is_dir():
+            for pattern in MANIFEST_SUFFIXES:
+                files.update(p for p in path.rglob(pattern) if p.is_file())
+        elif path.exists():
+            files.add(path)
+        else:
+            files.update(Path(p) for p in glob.glob(source, recursive=True) if Path(p).is_file())
+    return sorted(files)
+
+
+def plan_work(files: list[Path], chunk_bytes: int = CHUNK_BYTES) -> list[tuple[str, int, Optional[int], int]]:
+    """Cut files into (path, start, end, first line) units of whole documents, in file order."""
+    units = []
+    for path in files:
+        info = path.stat()
+        if not stat.S_ISREG(info.st_mode) or info.st_size <= chunk_bytes:
+            units.append((str(path), 0, None, 1))
+            continue
+        with open_manifest(path) as buffer:
+            start, line = 0, 1
+            for _, end in document_ranges(buffer):
+                if end - start >= chunk_bytes:
+                    units.append((str(path), start, end, line))
+                    line += buffer[start:end].count(b"\n")
+                    start = end
+            if start < len(buffer):
+                units.append((str(path), start, None, line))
+    return units
+
+
+def check_document(
+    raw: bytes, line: int, schema: Optional[SchemaValidator], policy: Policy, index: bool
+) -> list:
+    """Parse and check one document's bytes.
+
+    Returns [documents, [[offset, rule id, message]...], [[offset, record]...]] with
+    line offsets relative to `line`, so a cached result fits the same
+    document wherever it moves in the file.
+    """
+    parsed = parse_document(raw, line)
+    if parsed is None:
+        return [0, [], []]
+    head, doc = parsed
+    if isinstance(doc, ManifestError):
+        return [1, [[doc.line - line, "yaml-syntax", f"Invalid YAML: {doc.message}"]], []]
+    offset = head - line
+    findings = [[offset, rule, message] for rule, message in validate_manifest(doc, schema, policy)]
+    records = [[offset, record] for record in index_document(doc)] if index else []
+    return [1, findings, records]
+
+
+def validate_range(
+    path: str,
+    start: int = 0,
+    end: Optional[int] = None,
+    first_line: int = 1,
+    cross_refs: bool = False,
+    schema_path: Optional[str] = None,
+    cache_path: Optional[str] = None,
+    rules_paths: tuple[str, ...] = (),
+) -> tuple[int, list, list, list, list]:
+    """Validate the documents in one byte range of a file (safe to run in a worker).
+
+    Returns the document count, (line, rule id, message) findings in document order,
+    (line, record) bundle index records when cross_refs is set, and, with a
+    result cache, the (key, result) entries computed here and the keys of
+    cached results that were reused. Cache writes are left to the caller.
+    """
+    schema = load_schema(schema_path) if schema_path else None
+    policy = load_policy(rules_paths)
+    salt = f"{RESULT_CACHE_VERSION}\0{VALIDATOR_DIGEST}\0{schema.digest if schema else ''}\0{policy.digest}\0".encode()
+    documents = 0
+    findings = []
+    records = []
+    computed = []
+    reused = []
+    with open_manifest(Path(path)) as buffer:
+        for line, raw in document_slices(buffer, start, end, first_line):
+            result = None
+            if cache_path:
+                key = result_key(raw, salt)
+                result = cached_result(cache_path, key)
+                if result is not None:
+                    reused.append(key)
+            if result is None:
+                # Cached results always carry index records so they serve --cross-refs runs too
+                result = check_document(raw, line, schema, policy, cross_refs or bool(cache_path))
+                if cache_path:
+                    computed.append((key, json.dumps(result, separators=(",", ":"))))
+            count, doc_findings, doc_records = result
+            documents += count
+            findings.extend((line + offset, rule, message) for offset, rule, message in doc_findings)
+            if cross_refs:
+                records.extend((line + offset, record) for offset, record in doc_records)
+    return documents, findings, records, computed, reused
+
+
+def validate_files(
+    files: list[Path],
+    jobs: int,
+    cross_refs: bool = False,
+    schema_path: Optional[str] = None,
+    cache_dir: Optional[Path] = None,
+    rules_paths: tuple[str, ...] = (),
+) -> Iterator[dict]:
+    """Validate files on a worker pool, yielding one result per file in input order.
+
+    With cross_refs the inputs are treated as one bundle: workers return index
+    records alongside their findings, and the reference checks run once every
+    file is in, so results are held back until then. With a cache_dir,
+    documents whose normalized bytes were validated before are not parsed
+    again; this process is the only cache writer.
+    """
+    units = plan_work(files)
+    paths = [unit[0] for unit in units]
+    cache = None
+    if cache_dir:
+        try:
+            cache = open_result_cache(cache_dir)
+        except (OSError, sqlite3.Error):
+            pass  # An unwritable cache only costs a cold run
+    cache_path = str(cache_dir / RESULT_CACHE_FILE) if cache is not None else None
+    stamp = time.time_ns()
+    options = [(cross_refs, schema_path, cache_path, rules_paths)] * len(units)
+
+    # Pipes can only be read once, by this process
+    regular = all(Path(path).is_file() for path in set(paths))
+    if jobs > 1 and len(units) > 1 and regular:
+        pool = ProcessPoolExecutor(max_workers=jobs)
+        chunksize = max(1, len(units) // (jobs * 4))
+        results = pool.map(validate_range, *zip(*units), *zip(*options), chunksize=chunksize)
+    else:
+        pool = None
+        results = (validate_range(*unit, *option) for unit, option in zip(units, options))
+
+    try:
+        per_file = []
+        records = []
+        current = None
+        for path, (documents, findings, unit_records, computed, reused) in zip(paths, results):
+            if current is None or current["file"] != path:
+                if current is not None and not cross_refs:
+                    yield current
+                current = {"file": path, "documents": 0, "errors": []}
+                per_file.append(current)
+            current["documents"] += documents
+            current["errors"].extend(
+                {"line": line, "message": message, "rule": rule} for line, rule, message in findings
+            )
+            records.extend((path, line, record) for line, record in unit_records)
+            if cache is not None:
+                store_results(cache, computed, reused, stamp)
+        if cache is not None:
+            cache.commit()
+            evict_results(cache)
+        if not cross_refs:
+            if current is not None:
+                yield current
+            return
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if cache is not None:
+            cache.close()
+
+    by_path = {result["file"]: result for result in per_file}
+    for path, line, rule, message in cross_reference(records):
+        by_path[path]["errors"].append({"line": line, "message": message, "rule": rule})
+    for result in per_file:
+        result["errors"].sort(key=lambda error: error["line"])
+        yield result
+
+
+def emit_text(results: Iterable[dict], label: str, with_location: bool) -> int:
+    """Print the human-readable report and return the issue count."""
+    print(f"Validating: {label}")
+    print("=" * 50)
+
+    count = 0
+    for result in results:
+        for error in result["errors"]:
+            count += 1
+            if with_location or error["rule"] == "yaml-syntax":
+                print(f"❌ {result['file']}:{error['line']}: {error['message']}")
+            else:
+                print(f"❌ {error['message']}")
+
+    if count:
+        print("=" * 50)
+        print(f"Found {count} issue(s)")
+    else:
+        print("✓ All checks passed!")
+    return count
+
+
+def emit_ndjson(results: Iterable[dict]) -> int:
+    """Print one NDJSON line per file plus a summary line; return the issue count."""
+    totals = {"files": 0, "documents": 0, "failed": 0, "errors": 0}
+    for result in results:
+        print(json.dumps(result, ensure_ascii=False))
+        totals["files"] += 1
+        totals["documents"] += result["documents"]
+        totals["failed"] += bool(result["errors"])
+        totals["errors"] += len(result["errors"])
+    print(json.dumps({"summary": totals}))
+    return totals["errors"]
+
+
+def emit_sarif(results: Iterable[dict], policy: Policy = DEFAULT_POLICY) -> int:
+    """Print a SARIF 2.1.0 log for code-scanning uploads; return the issue count."""
+    sarif_results = []
+    used_rules = set()
+    for result in results:
+        uri = Path(result["file"]).as_posix()
+        for error in result["errors"]:
+            rule = error["rule"]
+            used_rules.add(rule)
+            sarif_results.append({
+                "ruleId": rule,
+                "level": "error",
+                "message": {"text": error["message"]},
+                "locations": [{
+                    "physicalLocation": {
+                        "artifactLocation": {"uri": uri},
+                        "region": {"startLine": error["line"]},
+                    }
+                }],
+            })
+
+    log = {
+        "$schema": "https://json.schemastore.org/sarif-2.1.0.json",
+        "version": "2.1.0",
+        "runs": [{
+            "tool": {
+                "driver": {
+                    "name": "validate-k8s-manifest",
+                    "rules": [
+                        {"id": rule, "shortDescription": {"text": description}}
+                        for rule, description in {**policy.descriptions, **RULES}.items() if rule in used_rules
+                    ],
+                }
+            },
+            "results": sarif_results,
+        }],
+    }
+    print(json.dumps(log, indent=2, ensure_ascii=False))
+    return len(sarif_results)
+
+
 def main():
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(description="Validate Kubernetes manifests for best practices")
+    parser.add_argument("sources", nargs="*", help="Manifest files, directories, or globs")
+    parser.add_argument("--format", choices=("text", "ndjson", "sarif"), default="text", help="Report format")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument(
+        "--cross-refs", action="store_true",
+        help="Treat all inputs as one bundle and check references between documents",
+    )
+    parser.add_argument(
+        "--cache-dir", type=Path, default=default_cache_dir(),
+        help="Per-document result cache directory (default: $XDG_CACHE_HOME/loaf)",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache")
+    parser.add_argument(
+        "--rules", metavar="FILE", action="append", default=[],
+        help="Extra policy rules (YAML or JSON); repeatable",
+    )
+    parser.add_argument(
+        "--schema", metavar="FILE",
+        help="Also check documents against a local Kubernetes OpenAPI file (swagger.json)",
+    )
+    args = parser.parse_args()
+
+    if not args.sources:
         print("Usage: validate-k8s-manifest.py <manifest.yaml>")
+        print("       validate-k8s-manifest.py <file|dir|glob>... [--format text|ndjson|sarif] [--jobs N] [--cross-refs] [--schema FILE] [--rules FILE]")
         sys.exit(1)
 
-    manifest_path = Path(sys.argv[1])
-    if not manifest_path.exists():
-        print(f"Error: File not found: {manifest_path}")
+    files = collect_manifest_files(args.sources)
+    if not files:
+        print(f"Error: File not found: {' '.join(args.sources)}")
         sys.exit(1)
 
-    print(f"Validating: {manifest_path}")
-    print("=" * 50)
-
-    all_errors = []
+    if args.schema:
+        # Compile (or load the cached build) once, before any worker needs it
+        try:
+            load_schema(args.schema)
+        except (OSError, ValueError) as e:
+            print(f"Error: Cannot load schema {args.schema}: {e}")
+            sys.exit(1)
 
-    docs = manifest_documents(manifest_path.read_text())
-    for doc in docs:
-        errors = validate_manifest(doc)
-        all_errors.extend(errors)
-
-    if all_errors:
-        for error in all_errors:
-            print(f"❌ {error}")
-        print("=" * 50)
-        print(f"Found {len(all_errors)} issue(s)")
+    rules_paths = tuple(args.rules)
+    try:
+        policy = load_policy(rules_paths)
+    except (OSError, ValueError) as e:
+        print(f"Error: Cannot load rules: {e}")
         sys.exit(1)
+
+    cache_dir = None if args.no_cache else args.cache_dir
+    results = validate_files(files, args.jobs, args.cross_refs, args.schema, cache_dir, rules_paths)
+    if args.format == "ndjson":
+        issues = emit_ndjson(results)
+    elif args.format == "sarif":
+        issues = emit_sarif(results, policy)
     else:
-        print("✓ All checks passed!")
-        sys.exit(0)
+        single = len(args.sources) == 1 and files == [Path(args.sources[0])]
+        label = str(files[0]) if single else f"{len(files)} file(s)"
+        issues = emit_text(results, label, with_location=not single)
+
+    sys.exit(1 if issues else 0)
 
 
 if __name__ == "__main__":
@@ -3,21 +3,45 @@
 
 Usage:
     suggest-team.py "task description"
-    suggest-team.py --list-teams              # List all workspace teams
+    suggest-team.py --list-teams              # List cached workspace teams
+    suggest-team.py --cache-teams teams.json  # Cache teams fetched via Linear MCP (- for stdin)
     suggest-team.py --add-known "Team Name"   # Add team to known_teams
+    suggest-team.py --record "Team Name" "task description"  # Learn from an assignment
+    suggest-team.py --rebuild-index           # Rebuild the routing index
 
 Returns JSON with:
     - suggested_team: Team name and ID
     - confidence: high/medium/low
     - needs_confirmation: true if team is new to project
     - reason: Why this team was suggested
+
+Routing uses a BM25 index over each team's keywords plus recorded past
+assignments. The index lives next to the config as team-index.json and is
+rebuilt automatically when team_keywords or known_teams change.
+
+Workspace teams are cached in teams-cache.json (also next to the config) so
+routing does not need a Linear round trip per task. The cache carries an
+ETag-style content hash and expires after linear.team_cache_ttl seconds
+(default 24h); stale entries are still served, flagged as stale.
 """
 
+import hashlib
 import json
+import math
+import os
 import re
-import subprocess
+import stat
 import sys
+import tempfile
+import time
+from contextlib import contextmanager
 from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory locks, writes stay atomic
+    fcntl = None
 
 
 def find_config() -> Path:
@@ -42,49 +66,409 @@ def load_config() -> dict:
         return json.load(f)
 
 
+def file_version(path: Path) -> tuple[int, int, int]:
+    """Identify a file's committed version by inode, mtime and size."""
+    st = path.stat()
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+@contextmanager
+def file_lock(path: Path) -> Iterator[None]:
+    """Hold an exclusive advisory lock for read-modify-write of ``path``.
+
+    The lock lives on a sibling ``.lock`` file because commits replace the
+    target's inode via rename. The holder removes it before releasing, so
+    no lock files are left behind; a waiter that wakes up holding a removed
+    inode retries on a fresh file.
+    """
+    if fcntl is None:
+        yield
+        return
+    lock_path = path.with_name(path.name + ".lock")
+    while True:
+        lock = open(lock_path, "a")
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        try:
+            if os.path.samestat(os.fstat(lock.fileno()), os.stat(lock_path)):
+                break
+        except FileNotFoundError:
+            pass
+        lock.close()
+    try:
+        yield
+    finally:
+        try:
+            os.unlink(lock_path)
+        except FileNotFoundError:
+            pass
+        lock.close()
+
+
+def file_mode(path: Path) -> int:
+    """Permission bits to give a replacement of ``path``.
+
+    An existing file keeps its mode; a new one gets the default 0666 & ~umask.
+    """
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def write_json_atomic(path: Path, data: dict, indent: Optional[int] = 2) -> None:
+    """Write JSON to a temp file and rename it over ``path``.
+
+    Readers see either the old or the new file, never a truncated one. The
+    temp file starts out 0600, so it takes the original's mode first.
+    """
+    mode = file_mode(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            if hasattr(os, "fchmod"):
+                os.fchmod(f.fileno(), mode)
+            if indent is None:
+                json.dump(data, f, separators=(",", ":"))
+            else:
+                json.dump(data, f, indent=indent)
+                f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
 def save_config(config: dict) -> None:
-    """Save project configuration."""
-    config_path = find_config()
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
-        f.write("\n")
+    """Save project configuration atomically.
+
+    Callers doing read-modify-write should hold ``file_lock`` on the config.
+    """
+    write_json_atomic(find_config(), config)
+
+
+INDEX_FILENAME = "team-index.json"
+INDEX_VERSION = 1
+
+# BM25 parameters (standard defaults)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Words too common to say anything about a team when learning from assignments
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in",
+    "into", "is", "it", "of", "on", "or", "the", "this", "to", "when", "with",
+}
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens."""
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def keyword_term(keyword: str) -> str:
+    """Normalize a (possibly multi-word) keyword into an index term."""
+    return " ".join(tokenize(keyword))
+
+
+def query_terms(description: str, max_ngram: int) -> set[str]:
+    """Return every 1..max_ngram token sequence in the description."""
+    tokens = tokenize(description)
+    terms = set()
+    for n in range(1, max_ngram + 1):
+        for i in range(len(tokens) - n + 1):
+            terms.add(" ".join(tokens[i:i + n]))
+    return terms
+
+
+def routing_teams(linear_config: dict) -> dict[str, list[str]]:
+    """Map every routable team (keyworded or known) to its keywords."""
+    teams = {team: list(keywords) for team, keywords in linear_config.get("team_keywords", {}).items()}
+    for known in linear_config.get("known_teams", []):
+        if known.get("name"):
+            teams.setdefault(known["name"], [])
+    return teams
+
+
+def teams_fingerprint(teams: dict) -> str:
+    """Hash the routable teams so a stale index can be detected."""
+    payload = json.dumps(teams, sort_keys=True).encode()
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def index_path() -> Path:
+    """Locate the routing index next to the project config."""
+    return find_config().parent / INDEX_FILENAME
+
+
+def empty_index(teams: dict) -> dict:
+    """Create an index with no postings for the given teams."""
+    return {
+        "version": INDEX_VERSION,
+        "teams_hash": teams_fingerprint(teams),
+        "max_ngram": 1,
+        "keywords": {},     # team -> {keyword term: keyword as configured}
+        "assignments": {},  # team -> {term: count} learned from --record
+        "postings": {},     # term -> {team: tf}
+        "doc_len": {},      # team -> total tf
+    }
+
+
+def index_add(index: dict, team: str, terms: dict[str, int]) -> None:
+    """Merge term frequencies for a team into the inverted index."""
+    postings = index["postings"]
+    for term, count in terms.items():
+        team_tf = postings.setdefault(term, {})
+        team_tf[team] = team_tf.get(team, 0) + count
+        index["doc_len"][team] = index["doc_len"].get(team, 0) + count
+        index["max_ngram"] = max(index["max_ngram"], term.count(" ") + 1)
+
+
+def index_add_team(index: dict, team: str, keywords: list[str]) -> None:
+    """Index a team's name and configured keywords (once each)."""
+    terms: dict[str, str] = {}
+    for keyword in [team, *keywords]:
+        term = keyword_term(keyword)
+        if term:
+            terms.setdefault(term, keyword)
+    index["keywords"][team] = terms
+    index["doc_len"].setdefault(team, 0)
+    index_add(index, team, {t: 1 for t in terms})
+
+
+def build_index(teams: dict, assignments: dict | None = None) -> dict:
+    """Build the routing index from team keywords and recorded assignments."""
+    index = empty_index(teams)
+    for team, keywords in teams.items():
+        index_add_team(index, team, keywords)
+    for team, terms in (assignments or {}).items():
+        index["assignments"][team] = dict(terms)
+        index_add(index, team, terms)
+    return index
+
+
+def read_index() -> Optional[dict]:
+    """Read the routing index as stored, or None if missing or unusable."""
+    try:
+        with open(index_path()) as f:
+            index = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if not isinstance(index, dict) or index.get("version") != INDEX_VERSION:
+        return None
+    return index
 
 
-def get_workspace_teams() -> list[dict]:
-    """Fetch all teams from Linear workspace via MCP.
+def refresh_index(index: Optional[dict], teams: dict) -> tuple[dict, bool]:
+    """Return (index, rebuilt), rebuilding if the team config has changed."""
+    if index and index.get("teams_hash") == teams_fingerprint(teams):
+        return index, False
+    return build_index(teams, (index or {}).get("assignments")), True
 
-    Note: This is a placeholder. In practice, the agent uses the
-    Linear MCP tools directly. This script provides the logic.
+
+def load_index(teams: dict) -> dict:
+    """Load the routing index, rebuilding it if missing or stale.
+
+    The common case is a lock-free read; only a rebuild takes the lock.
     """
-    # Return cached teams if available, or empty list
-    # The actual team fetching happens via Linear MCP in the harness
-    return []
+    index, rebuilt = refresh_index(read_index(), teams)
+    if not rebuilt:
+        return index
 
+    with file_lock(index_path()):
+        # Another agent may have rebuilt it while we waited
+        index, rebuilt = refresh_index(read_index(), teams)
+        if rebuilt:
+            save_index(index)
+    return index
 
-def analyze_task(description: str, team_keywords: dict) -> list[tuple[str, int, str]]:
-    """Analyze task description and score teams by keyword matches.
 
-    Returns list of (team_name, score, matched_keywords) sorted by score.
+def save_index(index: dict) -> None:
+    """Write the routing index in compact form."""
+    write_json_atomic(index_path(), index, indent=None)
+
+
+TEAM_CACHE_FILENAME = "teams-cache.json"
+DEFAULT_TEAM_CACHE_TTL = 24 * 60 * 60
+
+
+def team_cache_path() -> Path:
+    """Locate the workspace team cache next to the project config."""
+    return find_config().parent / TEAM_CACHE_FILENAME
+
+
+def teams_etag(teams: list[dict]) -> str:
+    """Content hash of a team list, used like an HTTP ETag."""
+    payload = json.dumps(sorted(teams, key=lambda t: t.get("name", "")), sort_keys=True).encode()
+    return hashlib.sha256(payload).hexdigest()[:16]
+
+
+def load_team_cache() -> Optional[dict]:
+    """Read the team cache file, or None if it is missing, unreadable or malformed."""
+    try:
+        with open(team_cache_path()) as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+    if not isinstance(cache, dict):
+        return None
+    teams = cache.get("teams")
+    if not isinstance(teams, list) or not all(isinstance(team, dict) for team in teams):
+        return None
+    return cache
+
+
+def team_cache_ttl(config: dict) -> int:
+    """Team cache lifetime in seconds (linear.team_cache_ttl), or the default if unset or invalid."""
+    try:
+        return int(config["linear"]["team_cache_ttl"])
+    except (KeyError, ValueError, TypeError):
+        return DEFAULT_TEAM_CACHE_TTL
+
+
+def cache_is_stale(cache: dict, ttl: int, now: Optional[float] = None) -> bool:
+    """Check whether the cache is older than its TTL."""
+    now = time.time() if now is None else now
+    return now - cache.get("fetched_at", 0) > ttl
+
+
+def cache_teams(teams: list[dict]) -> dict:
+    """Store teams fetched via Linear MCP in the local cache.
+
+    An unchanged team list (same ETag) only refreshes fetched_at.
     """
-    description_lower = description.lower()
-    scores = []
+    teams = [
+        {"name": t["name"], "id": t.get("id", ""), **({"key": t["key"]} if t.get("key") else {})}
+        for t in teams
+        if t.get("name")
+    ]
+    etag = teams_etag(teams)
+    cache_path = team_cache_path()
+    with file_lock(cache_path):
+        previous = load_team_cache()
+        status = "unchanged" if previous and previous.get("etag") == etag else "updated"
+        cache = {"etag": etag, "fetched_at": int(time.time()), "teams": teams}
+        write_json_atomic(cache_path, cache)
+    return {"status": status, "etag": etag, "teams": len(teams)}
+
+
+def get_workspace_teams(loader: Optional[Callable[[], Optional[dict]]] = None) -> list[dict]:
+    """Return workspace teams from the local cache.
+
+    The agent populates the cache once from the Linear MCP tools
+    (``--cache-teams``); this never goes to the network. Pass ``loader`` to
+    substitute a stand-in source (e.g. a fixture in tests).
+    """
+    cache = (loader or load_team_cache)()
+    if not cache:
+        return []
+    return cache.get("teams", [])
 
-    for team, keywords in team_keywords.items():
-        matched = []
-        score = 0
-        for keyword in keywords:
-            # Check for keyword (word boundary matching)
-            pattern = r'\b' + re.escape(keyword.lower()) + r'\b'
-            if re.search(pattern, description_lower):
-                matched.append(keyword)
-                score += 1
 
-        if score > 0:
-            scores.append((team, score, ", ".join(matched)))
+def find_workspace_team(team_name: str, teams: list[dict]) -> Optional[dict]:
+    """Find a workspace team by name (case-insensitive) or key."""
+    wanted = team_name.lower()
+    for team in teams:
+        if team.get("name", "").lower() == wanted or team.get("key", "").lower() == wanted:
+            return team
+    return None
 
-    # Sort by score descending
-    scores.sort(key=lambda x: x[1], reverse=True)
-    return scores
+
+def list_teams(loader: Optional[Callable[[], Optional[dict]]] = None) -> dict:
+    """Describe the cached workspace teams and cache freshness."""
+    cache = (loader or load_team_cache)()
+    if not cache:
+        return {
+            "teams": [],
+            "cached": False,
+            "suggestion": "Fetch teams with the Linear MCP tools, then run suggest-team.py --cache-teams <file>"
+        }
+    try:
+        ttl = team_cache_ttl(load_config())
+    except FileNotFoundError:
+        ttl = DEFAULT_TEAM_CACHE_TTL
+    return {
+        "teams": cache["teams"],
+        "cached": True,
+        "etag": cache.get("etag", ""),
+        "fetched_at": cache.get("fetched_at", 0),
+        "stale": cache_is_stale(cache, ttl),
+    }
+
+
+def analyze_task(description: str, index: dict) -> list[tuple[str, float, list[str]]]:
+    """Score teams against a task description with BM25.
+
+    Rare keywords weigh more than keywords shared by many teams, and terms
+    learned from recorded assignments contribute alongside configured ones.
+
+    Returns list of (team_name, score, matched_keywords) sorted by score.
+    """
+    postings = index["postings"]
+    doc_len = index["doc_len"]
+    n_docs = len(doc_len)
+    if n_docs == 0:
+        return []
+    avg_len = (sum(doc_len.values()) / n_docs) or 1.0
+
+    scores: dict[str, float] = {}
+    matched: dict[str, list[str]] = {}
+    for term in query_terms(description, index["max_ngram"]):
+        team_tf = postings.get(term)
+        if not team_tf:
+            continue
+        df = len(team_tf)
+        idf = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+        for team, tf in team_tf.items():
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * doc_len[team] / avg_len)
+            scores[team] = scores.get(team, 0.0) + idf * tf * (BM25_K1 + 1) / (tf + norm)
+            keyword = index["keywords"].get(team, {}).get(term)
+            if keyword:
+                matched.setdefault(team, []).append(keyword)
+
+    ranked = [(team, score, sorted(matched.get(team, []))) for team, score in scores.items()]
+    # Sort by score descending, name as a stable tie-breaker
+    ranked.sort(key=lambda x: (-x[1], x[0]))
+    return ranked
+
+
+def record_assignment(team_name: str, description: str) -> dict:
+    """Learn from a past assignment by adding its terms to the team's document."""
+    config = load_config()
+    with file_lock(index_path()):
+        index, _ = refresh_index(read_index(), routing_teams(config.get("linear", {})))
+
+        vocabulary = {t for terms in index["keywords"].values() for t in terms}
+        terms: dict[str, int] = {}
+        for term in query_terms(description, index["max_ngram"]):
+            if " " in term and term not in vocabulary:
+                continue
+            if term in STOPWORDS:
+                continue
+            terms[term] = terms.get(term, 0) + 1
+
+        learned = index["assignments"].setdefault(team_name, {})
+        for term, count in terms.items():
+            learned[term] = learned.get(term, 0) + count
+        index_add(index, team_name, terms)
+        save_index(index)
+    return {"status": "recorded", "team": team_name, "terms": len(terms)}
+
+
+def rebuild_index() -> dict:
+    """Rebuild the routing index from config, keeping recorded assignments."""
+    config = load_config()
+    teams = routing_teams(config.get("linear", {}))
+    with file_lock(index_path()):
+        index = build_index(teams, (read_index() or {}).get("assignments"))
+        save_index(index)
+    return {"status": "rebuilt", "teams": len(index["doc_len"]), "terms": len(index["postings"])}
 
 
 def is_team_known(team_name: str, config: dict) -> bool:
@@ -94,25 +478,59 @@ def is_team_known(team_name: str, config: dict) -> bool:
 
 
 def add_known_team(team_name: str, team_id: str = "") -> dict:
-    """Add a team to known_teams in config."""
-    config = load_config()
+    """Add a team to known_teams in config.
 
-    if "linear" not in config:
-        config["linear"] = {}
-    if "known_teams" not in config["linear"]:
-        config["linear"]["known_teams"] = []
+    Safe to run from many agents at once: the config is updated under an
+    advisory lock and committed with an atomic rename. Teams that are
+    already known return without taking the lock or writing.
+    """
+    config_path = find_config()
 
-    # Check if already known
+    # Fast path: an unlocked snapshot answers the common no-op case
+    snapshot = file_version(config_path)
+    config = load_config()
     if is_team_known(team_name, config):
         return {"status": "already_known", "team": team_name}
 
-    # Add team
-    config["linear"]["known_teams"].append({
-        "name": team_name,
-        "id": team_id
-    })
+    # Fill in the ID from the workspace team cache when not given
+    if not team_id:
+        workspace_team = find_workspace_team(team_name, get_workspace_teams())
+        team_id = workspace_team.get("id", "") if workspace_team else ""
+
+    with file_lock(config_path):
+        # Another agent committed since the snapshot: re-read and re-check
+        if file_version(config_path) != snapshot:
+            config = load_config()
+            if is_team_known(team_name, config):
+                return {"status": "already_known", "team": team_name}
+
+        if "linear" not in config:
+            config["linear"] = {}
+        if "known_teams" not in config["linear"]:
+            config["linear"]["known_teams"] = []
+
+        teams_before = routing_teams(config["linear"])
+
+        # Add team
+        config["linear"]["known_teams"].append({
+            "name": team_name,
+            "id": team_id
+        })
+
+        save_config(config)
+
+    # Index the new team incrementally instead of rebuilding. Only an index
+    # that reflects the config we just extended can be patched; anything
+    # else is rebuilt lazily on the next load.
+    with file_lock(index_path()):
+        index = read_index()
+        if index and index.get("teams_hash") == teams_fingerprint(teams_before):
+            if team_name not in index["doc_len"]:
+                team_keywords = config["linear"].get("team_keywords", {})
+                index_add_team(index, team_name, team_keywords.get(team_name, []))
+            index["teams_hash"] = teams_fingerprint(routing_teams(config["linear"]))
+            save_index(index)
 
-    save_config(config)
     return {"status": "added", "team": team_name}
 
 
@@ -139,7 +557,7 @@ def suggest_team(description: str) -> dict:
         }
 
     # Analyze task
-    scores = analyze_task(description, team_keywords)
+    scores = analyze_task(description, load_index(routing_teams(linear_config)))
 
     if not scores:
         # No keyword matches, use default
@@ -153,10 +571,11 @@ def suggest_team(description: str) -> dict:
     # Best match
     best_team, score, matched = scores[0]
 
-    # Determine confidence
-    if score >= 3:
+    # Determine confidence from matched keywords and the lead over the runner-up
+    runner_up = scores[1][1] if len(scores) > 1 else 0.0
+    if len(matched) >= 3 or (len(matched) >= 2 and score >= 2 * runner_up):
         confidence = "high"
-    elif score >= 2:
+    elif len(matched) >= 2 or (matched and score >= 2 * runner_up):
         confidence = "medium"
     else:
         confidence = "low"
@@ -164,13 +583,21 @@ def suggest_team(description: str) -> dict:
     # Check if team is new to project
     needs_confirmation = not is_team_known(best_team, config)
 
+    suggested = {"name": best_team}
+    workspace_team = find_workspace_team(best_team, get_workspace_teams())
+    if workspace_team:
+        suggested["id"] = workspace_team.get("id", "")
+
     result = {
-        "suggested_team": {"name": best_team},
+        "suggested_team": suggested,
         "confidence": confidence,
         "needs_confirmation": needs_confirmation,
-        "reason": f"Matched keywords: {matched}",
+        "reason": (
+            f"Matched keywords: {', '.join(matched)}" if matched
+            else "Matched terms from past assignments"
+        ),
         "alternatives": [
-            {"name": t, "score": s, "keywords": k}
+            {"name": t, "score": round(s, 3), "keywords": ", ".join(k)}
             for t, s, k in scores[1:3]  # Top 2 alternatives
         ]
     }
@@ -187,10 +614,44 @@ def suggest_team(description: str) -> dict:
 def main():
     if len(sys.argv) < 2:
         print("Usage: suggest-team.py <task description>", file=sys.stderr)
+        print("       suggest-team.py --list-teams", file=sys.stderr)
+        print("       suggest-team.py --cache-teams <teams.json|->", file=sys.stderr)
         print("       suggest-team.py --add-known <team-name> [team-id]", file=sys.stderr)
+        print("       suggest-team.py --record <team-name> <task description>", file=sys.stderr)
+        print("       suggest-team.py --rebuild-index", file=sys.stderr)
         sys.exit(1)
 
-    if sys.argv[1] == "--add-known":
+    if sys.argv[1] == "--list-teams":
+        print(json.dumps(list_teams(), indent=2))
+    elif sys.argv[1] == "--cache-teams":
+        if len(sys.argv) < 3:
+            print("Usage: suggest-team.py --cache-teams <teams.json|->", file=sys.stderr)
+            sys.exit(1)
+        try:
+            if sys.argv[2] == "-":
+                payload = json.load(sys.stdin)
+            else:
+                with open(sys.argv[2]) as f:
+                    payload = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"Error: Cannot read teams from {sys.argv[2]}: {e}", file=sys.stderr)
+            sys.exit(1)
+        # Accept a bare list or an MCP-style {"teams": [...]} / {"nodes": [...]}
+        if isinstance(payload, dict):
+            payload = payload.get("teams", payload.get("nodes", []))
+        if not isinstance(payload, list):
+            print("Error: Teams must be a list of team objects", file=sys.stderr)
+            sys.exit(1)
+        for index, team in enumerate(payload):
+            if not isinstance(team, dict):
+                print(f"Error: Team entry {index} is not an object: {json.dumps(team)}", file=sys.stderr)
+                sys.exit(1)
+            for field in ("name", "id", "key"):
+                if team.get(field) is not None and not isinstance(team[field], str):
+                    print(f"Error: Team entry {index} has a non-string {field}", file=sys.stderr)
+                    sys.exit(1)
+        print(json.dumps(cache_teams(payload), indent=2))
+    elif sys.argv[1] == "--add-known":
         if len(sys.argv) < 3:
             print("Usage: suggest-team.py --add-known <team-name> [team-id]", file=sys.stderr)
             sys.exit(1)
@@ -198,6 +659,15 @@ def main():
         team_id = sys.argv[3] if len(sys.argv) > 3 else ""
         result = add_known_team(team_name, team_id)
         print(json.dumps(result, indent=2))
+    elif sys.argv[1] == "--record":
+        if len(sys.argv) < 4:
+            print("Usage: suggest-team.py --record <team-name> <task description>", file=sys.stderr)
+            sys.exit(1)
+        result = record_assignment(sys.argv[2], " ".join(sys.argv[3:]))
+        print(json.dumps(result, indent=2))
+    elif sys.argv[1] == "--rebuild-index":
+        result = rebuild_index()
+        print(json.dumps(result, indent=2))
     else:
         # Join all args as description
         description = " ".join(sys.argv[1:])
@@ -2,10 +2,22 @@
 """Validate roadmap format for Now/Next/Later structure.
 
 Usage: validate-roadmap.py <roadmap-file.md>
+       validate-roadmap.py [--root DIR]... [--jobs N] [--no-cache] [<roadmap-file.md>...]
+
+Portfolio mode (several files, or --root to find every docs/ROADMAP.md
+under a workspace) validates roadmaps concurrently and prints a JSON report
+with per-file issue counts. Results are cached by content hash under
+$XDG_CACHE_HOME/loaf/, so unchanged roadmaps are not re-checked.
 """
 
+import argparse
+import hashlib
+import json
+import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Patterns that indicate problematic content
@@ -38,62 +50,216 @@ PHASE_PATTERNS = [
 ]
 
 
+# (category, patterns, flags, message); order is the report order
+CATEGORIES = [
+    ("version", VERSION_PATTERNS, re.IGNORECASE, "Version number found (use Now/Next/Later instead)"),
+    ("date", DATE_PATTERNS, 0, "Date found (avoid time-based planning)"),
+    ("time_estimate", TIME_ESTIMATE_PATTERNS, re.IGNORECASE, "Time estimate found (avoid duration estimates)"),
+    ("phase", PHASE_PATTERNS, re.IGNORECASE, "Phase/Sprint terminology (use Now/Next/Later)"),
+]
+
+
+def _scoped(patterns: list[str], flags: int) -> str:
+    """Alternation of patterns with their case flag applied locally."""
+    return f"(?{'i' if flags & re.IGNORECASE else ''}:{'|'.join(patterns)})"
+
+
+# Every category in one scanner; the matching named group classifies the hit
+SCANNER = re.compile("|".join(
+    f"(?P<{name}>{_scoped(patterns, flags)})" for name, patterns, flags, _ in CATEGORIES
+))
+# Per-category scanners, only consulted on lines that already have a hit:
+# two categories can overlap in one span and the fused scan reports one.
+CATEGORY_SCANNERS = {name: re.compile(_scoped(patterns, flags)) for name, patterns, flags, _ in CATEGORIES}
+
+SECTION = re.compile(r"##\s+(Now|Next|Later)", re.IGNORECASE)
+
+
 def check_roadmap(content: str) -> list[str]:
-    """Check roadmap content for format issues."""
+    """Check roadmap content for format issues.
+
+    Visits each line once: the section headings and every problem category
+    are detected in the same loop.
+    """
     errors = []
-    lines = content.split("\n")
+    has_section = False
+    hits: dict[str, list[int]] = {name: [] for name, _, _, _ in CATEGORIES}
+
+    for i, line in enumerate(content.split("\n"), 1):
+        # Check for required sections
+        if not has_section and line.startswith("##") and SECTION.match(line):
+            has_section = True
 
-    # Check for required sections
-    has_now = bool(re.search(r"^##\s+Now", content, re.MULTILINE | re.IGNORECASE))
-    has_next = bool(re.search(r"^##\s+Next", content, re.MULTILINE | re.IGNORECASE))
-    has_later = bool(re.search(r"^##\s+Later", content, re.MULTILINE | re.IGNORECASE))
+        found = {match.lastgroup for match in SCANNER.finditer(line)}
+        if not found:
+            continue
+        for name, _, _, _ in CATEGORIES:
+            if name in found or CATEGORY_SCANNERS[name].search(line):
+                hits[name].append(i)
 
-    if not (has_now or has_next or has_later):
+    if not has_section:
         errors.append("Missing Now/Next/Later sections (need at least one)")
 
-    # Check for version numbers
-    for i, line in enumerate(lines, 1):
-        for pattern in VERSION_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                errors.append(f"Line {i}: Version number found (use Now/Next/Later instead)")
-                break
-
-    # Check for date estimates
-    for i, line in enumerate(lines, 1):
-        for pattern in DATE_PATTERNS:
-            if re.search(pattern, line):
-                errors.append(f"Line {i}: Date found (avoid time-based planning)")
-                break
-
-    # Check for time estimates
-    for i, line in enumerate(lines, 1):
-        for pattern in TIME_ESTIMATE_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                errors.append(f"Line {i}: Time estimate found (avoid duration estimates)")
-                break
-
-    # Check for phase/sprint terminology
-    for i, line in enumerate(lines, 1):
-        for pattern in PHASE_PATTERNS:
-            if re.search(pattern, line, re.IGNORECASE):
-                errors.append(f"Line {i}: Phase/Sprint terminology (use Now/Next/Later)")
-                break
+    for name, _, _, message in CATEGORIES:
+        errors.extend(f"Line {i}: {message}" for i in hits[name])
 
     return errors
 
 
+# Bump when the checks change so cached results are discarded
+CACHE_VERSION = 1
+# Cached results unseen for this long are dropped
+CACHE_MAX_AGE = 30 * 24 * 60 * 60
+# Directories never searched for roadmaps under --root
+SKIP_DIRS = {".git", "node_modules", "vendor", ".venv", "venv", "__pycache__"}
+# Below this many uncached files, process startup costs more than it saves
+POOL_THRESHOLD = 16
+
+
+def find_roadmaps(root: Path) -> list[Path]:
+    """Find every docs/ROADMAP.md under a workspace root."""
+    found = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS and not d.startswith(".")]
+        if os.path.basename(dirpath) == "docs" and "ROADMAP.md" in filenames:
+            found.append(Path(dirpath) / "ROADMAP.md")
+    return found
+
+
+def default_cache_path() -> Path:
+    """Result cache under $XDG_CACHE_HOME/loaf/."""
+    cache_root = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return cache_root / "loaf" / "roadmap-cache.json"
+
+
+def load_cache(cache_path: Path) -> dict:
+    """Load {content hash: {"errors": [...], "seen": ts}}, or {} if unusable."""
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if cache.get("version") != CACHE_VERSION:
+        return {}
+    return cache.get("results", {})
+
+
+def save_cache(cache_path: Path, results: dict) -> None:
+    """Write the cache atomically, dropping long-unseen entries."""
+    cutoff = time.time() - CACHE_MAX_AGE
+    results = {digest: entry for digest, entry in results.items() if entry["seen"] >= cutoff}
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"version": CACHE_VERSION, "results": results}, f, separators=(",", ":"))
+    os.replace(tmp_path, cache_path)
+
+
+def check_roadmap_bytes(data: bytes) -> list[str]:
+    """Pool worker entry point: decode and check one roadmap."""
+    try:
+        content = data.decode()
+    except UnicodeDecodeError as e:
+        return [f"Not valid UTF-8: {e}"]
+    return check_roadmap(content)
+
+
+def validate_portfolio(files: list[Path], jobs: int, cache_path: Path | None) -> dict:
+    """Validate many roadmaps concurrently, skipping ones cached by content hash."""
+    cache = load_cache(cache_path) if cache_path else {}
+    now = time.time()
+
+    contents = {}
+    digests = {}
+    unreadable = {}
+    for filepath in files:
+        try:
+            data = filepath.read_bytes()
+        except OSError as e:
+            unreadable[filepath] = [f"Unreadable: {e}"]
+            continue
+        digests[filepath] = hashlib.sha256(data).hexdigest()
+        if digests[filepath] not in cache:
+            contents[filepath] = data
+
+    # Identical roadmaps only need checking once
+    pending = {}
+    for filepath, data in contents.items():
+        pending.setdefault(digests[filepath], data)
+
+    if jobs > 1 and len(pending) >= POOL_THRESHOLD:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            checked = pool.map(check_roadmap_bytes, pending.values(), chunksize=max(1, len(pending) // (jobs * 4)))
+            fresh = dict(zip(pending, checked))
+    else:
+        fresh = {digest: check_roadmap_bytes(data) for digest, data in pending.items()}
+
+    for digest, errors in fresh.items():
+        cache[digest] = {"errors": errors, "seen": now}
+
+    results = []
+    for filepath in files:
+        if filepath in unreadable:
+            errors = unreadable[filepath]
+        else:
+            entry = cache[digests[filepath]]
+            entry["seen"] = now
+            errors = entry["errors"]
+        results.append({
+            "file": str(filepath),
+            "issues": len(errors),
+            "errors": errors,
+            "cached": filepath in digests and filepath not in contents,
+        })
+
+    if cache_path:
+        save_cache(cache_path, cache)
+
+    return {
+        "files": results,
+        "summary": {
+            "files": len(results),
+            "with_issues": sum(1 for r in results if r["issues"]),
+            "issues": sum(r["issues"] for r in results),
+            "cached": sum(1 for r in results if r["cached"]),
+        },
+    }
+
+
 def main():
-    if len(sys.argv) < 2:
+    parser = argparse.ArgumentParser(description="Validate roadmap format for Now/Next/Later structure")
+    parser.add_argument("files", nargs="*", type=Path, help="Roadmap files")
+    parser.add_argument("--root", action="append", type=Path, default=[],
+                        help="Workspace root to search for docs/ROADMAP.md (repeatable)")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the result cache")
+    args = parser.parse_args()
+
+    if not args.files and not args.root:
         print("Usage: validate-roadmap.py <roadmap-file.md>")
+        print("       validate-roadmap.py [--root DIR]... [--jobs N] [--no-cache] [<roadmap-file.md>...]")
         sys.exit(1)
 
-    filepath = Path(sys.argv[1])
-    if not filepath.exists():
-        print(f"Error: File not found: {filepath}")
+    missing = [f for f in args.files if not f.exists()]
+    if missing:
+        print(f"Error: File not found: {missing[0]}")
         sys.exit(1)
+    missing_roots = [root for root in args.root if not root.is_dir()]
+    if missing_roots:
+        print(f"Error: Directory not found: {missing_roots[0]}")
+        sys.exit(1)
+
+    if args.root or len(args.files) > 1:
+        files = list(args.files)
+        for root in args.root:
+            files.extend(find_roadmaps(root))
+        files = sorted(set(files))
+        report = validate_portfolio(files, args.jobs, None if args.no_cache else default_cache_path())
+        print(json.dumps(report, indent=2))
+        sys.exit(1 if report["summary"]["issues"] else 0)
 
-    content = filepath.read_text()
-    errors = check_roadmap(content)
+    filepath = args.files[0]
+    errors = check_roadmap_bytes(filepath.read_bytes())
 
     print(f"Validating roadmap: {filepath}")
     print("=" * 50)